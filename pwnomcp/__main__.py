@@ -4,6 +4,7 @@ Entry point for Pwno MCP server
 
 import argparse
 
+from pwnomcp.logger import configure_logging
 from pwnomcp.runtime import run_http, run_stdio
 
 
@@ -46,6 +47,7 @@ def _parse_args() -> argparse.Namespace:
 
 if __name__ == "__main__":
     cli_args = _parse_args()
+    configure_logging()
     if cli_args.stdio:
         run_stdio()
     else:
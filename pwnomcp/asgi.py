@@ -1,3 +1,6 @@
+from pwnomcp.logger import configure_logging
 from pwnomcp.server import mcp
 
+configure_logging()
+
 app = mcp.http_app(path="/mcp")
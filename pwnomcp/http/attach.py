@@ -1,12 +1,12 @@
-import asyncio
 import logging
 from typing import Any, Dict, Optional, Tuple
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 
 from pwnomcp.http.models import AttachRequest, AttachResponse
 from pwnomcp.services import AppServices
-from pwnomcp.tools.common import resolve_debug_session
+from pwnomcp.tools.common import resolve_debug_session, run_session_action
 from pwnomcp.utils.paths import DEFAULT_WORKSPACE, resolve_workspace_path
 
 logger = logging.getLogger(__name__)
@@ -18,6 +18,21 @@ def _resolve_session(body: AttachRequest, services: AppServices):
     )
 
 
+def _run_command(tools, cmd: str, phase: str, results: Dict[str, Any]) -> None:
+    """Run one pre/after command, recording its result or error under ``cmd``."""
+    logger.info("[attach] %s: %s", phase, cmd)
+    try:
+        res = tools.execute(cmd)
+    except Exception as e:
+        # Failing commands are routine here; skip the traceback
+        logger.error("[attach] %s command %r failed: %s", phase, cmd, e)
+        results[cmd] = {"success": False, "error": str(e)}
+        return
+    # Results carry full MI output; only format them when debugging
+    logger.debug("[attach] %s command result: %s", phase, res)
+    results[cmd] = res
+
+
 async def run_attach_request(
     body: AttachRequest, services: AppServices
 ) -> AttachResponse:
@@ -25,7 +40,8 @@ async def run_attach_request(
         session = _resolve_session(body, services)
     except Exception as exc:
         logger.exception("Failed to resolve debug session for attach request")
-        return AttachResponse(
+        # Responses are built from server-controlled values; skip re-validation.
+        return AttachResponse.model_construct(
             successful=False,
             attach={
                 "success": False,
@@ -56,20 +72,13 @@ async def run_attach_request(
                 command_results["set-file"] = {"success": False, "error": str(e)}
 
         for cmd in body.pre or []:
-            try:
-                logger.info("[attach] pre: %s", cmd)
-                res = tools.execute(cmd)
-                logger.info("[attach] pre command result: %s", res)
-                command_results[cmd] = res
-            except Exception as e:
-                logger.exception("Error executing pre command: %s", cmd)
-                command_results[cmd] = {"success": False, "error": str(e)}
+            _run_command(tools, cmd, "pre", command_results)
 
         attach_info: Optional[Dict[str, Any]] = None
         try:
             logger.info("[attach] attaching to pid=%s", body.pid)
             attach_result, _ = tools.attach(body.pid)
-            logger.info("[attach] attach result: %s", attach_result)
+            logger.debug("[attach] attach result: %s", attach_result)
             attach_success = bool(attach_result.get("success"))
             if attach_success:
                 session.state.pid = body.pid
@@ -90,28 +99,16 @@ async def run_attach_request(
 
         if attach_success:
             for cmd in body.after or []:
-                try:
-                    logger.info("[attach] after: %s", cmd)
-                    res = tools.execute(cmd)
-                    logger.info("[attach] after command result: %s", res)
-                    command_results[cmd] = res
-                except Exception as e:
-                    logger.exception("Error executing after command: %s", cmd)
-                    command_results[cmd] = {"success": False, "error": str(e)}
+                _run_command(tools, cmd, "after", command_results)
 
         return attach_success, attach_info, command_results
 
-    def _run_with_session_lock() -> (
-        Tuple[bool, Optional[Dict[str, Any]], Dict[str, Any]]
-    ):
-        with session.lock:
-            return _run_attach_sequence()
-
-    attach_success, attach_info, command_results = await asyncio.to_thread(
-        _run_with_session_lock
+    # Same session lock and bounded worker pool as the MCP debugger tools
+    attach_success, attach_info, command_results = await run_session_action(
+        session, _run_attach_sequence, sync_pid=False
     )
 
-    return AttachResponse(
+    return AttachResponse.model_construct(
         successful=attach_success,
         attach=attach_info,
         result=command_results,
@@ -120,6 +117,8 @@ async def run_attach_request(
 
 def create_attach_app(services: AppServices) -> FastAPI:
     app = FastAPI(title="pwno-mcp attach", version="0.2.0")
+    # Attach results embed raw MI/console output for every pre/after command.
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
     @app.get("/")
     async def root():
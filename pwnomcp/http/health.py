@@ -1,9 +1,12 @@
 from fastmcp import FastMCP
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
+
+# The health payload never changes; encode it once.
+_HEALTHZ_BODY = b'{"status":"ok"}'
 
 
 def register_health_routes(mcp: FastMCP) -> None:
     @mcp.custom_route("/healthz", methods=["GET"])
-    async def healthz(_request: Request) -> JSONResponse:
-        return JSONResponse({"status": "ok"})
+    async def healthz(_request: Request) -> Response:
+        return Response(_HEALTHZ_BODY, media_type="application/json")
@@ -1,11 +1,13 @@
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AttachRequest(BaseModel):
     """Request body for /attach."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     pre: Optional[List[str]] = Field(default=None)
     pid: int
     after: Optional[List[str]] = Field(default=None)
@@ -16,6 +18,8 @@ class AttachRequest(BaseModel):
 class AttachResponse(BaseModel):
     """Response body for /attach."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     successful: bool
     attach: Optional[Dict[str, Any]] = None
     result: Dict[str, Any]
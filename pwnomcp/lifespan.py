@@ -16,10 +16,19 @@ def create_lifespan(
         if managed_services is None:
             managed_services = create_services()
 
+        # Start RetDec right away so the result is ready by the first tool call
+        analyzer = managed_services.retdec_analyzer
+        retdec_task = None
+        if analyzer.binary_url:
+            retdec_task = analyzer.start()
+
         try:
             yield {"services": managed_services}
         finally:
             if owns_services:
+                # A shared analyzer outlives this server; leave its analysis running
+                if retdec_task is not None and not retdec_task.done():
+                    retdec_task.cancel()
                 close_services(managed_services)
 
     return _lifespan
@@ -1,33 +1,27 @@
 import os
 import logging
 
-logger = logging.getLogger("")
-handler: logging.Handler
 
-prod_env = os.getenv("PROD", False)
+def configure_logging() -> None:
+    """Install the process-wide log handler; call once from an entrypoint."""
+    root = logging.getLogger("")
+    handler: logging.Handler
 
-if prod_env:
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter(
-        "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
-    )
-    handler.setFormatter(formatter)
-else:
-    try:
-        from rich.logging import RichHandler
-
-        handler = RichHandler(rich_tracebacks=True)
-    except Exception:
+    if os.getenv("PROD", False):
         handler = logging.StreamHandler()
         formatter = logging.Formatter(
-            "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
+            "{asctime} - {levelname} - {name} - {message}", style="{"
         )
         handler.setFormatter(formatter)
+    else:
+        # rich is a core dependency; only pay its import cost outside PROD.
+        from rich.logging import RichHandler
+
+        handler = RichHandler(rich_tracebacks=True)
 
-logger.addHandler(handler)
-logger.setLevel(logging.INFO)
-logger.propagate = False
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
 
-logging.getLogger("httpx").setLevel(logging.WARNING)
-logging.getLogger("httpcore").setLevel(logging.WARNING)
-logging.getLogger("urllib3").setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    logging.getLogger("httpcore").setLevel(logging.WARNING)
+    logging.getLogger("urllib3").setLevel(logging.WARNING)
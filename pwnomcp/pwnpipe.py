@@ -1,18 +1,47 @@
 import threading
 import subprocess
-import queue
-import json
 import os
+import select
+import selectors
+import shlex
 import time
-from typing import Optional, List, Dict, Any
+from collections import deque
+from typing import Deque, Optional, List, Dict, Any
+
+from pwnomcp.utils.serialize import load_json
+
+# Oldest output lines/events are dropped once a driver produces more than this
+# without anyone releasing them.
+MAX_BUFFERED_LINES = 10000
+MAX_BUFFERED_EVENTS = 10000
+# Bytes requested per os.read() on the driver's stdout/stderr
+READ_CHUNK_SIZE = 65536
+# send() gives up if the driver stops draining its stdin for this long
+SEND_TIMEOUT_SEC = 10.0
+# How long the exit event waits for the reader to drain remaining output
+EXIT_DRAIN_TIMEOUT_SEC = 1.0
+
+_ATTACH_PREFIX = b"PWNCLI_ATTACH_RESULT:"
+_IPC_PREFIX = b"PWNO_IPC:"
+_ATTACH_LEN = len(_ATTACH_PREFIX)
+_IPC_LEN = len(_IPC_PREFIX)
+
+# Commands containing any of these need /bin/sh; others are exec'd directly
+_SHELL_CHARS = frozenset(";|&$`<>*?()[]{}~#!\n")
+
+# Readiness flags checked by wait_ready(), in priority order
+_F_ATTACH = 1
+_F_OUTPUT = 2
+_F_EXIT = 4
 
 
 class PwnPipe:
     """
-    Simple subprocess I/O pipeline with queued output buffer.
+    Simple subprocess I/O pipeline with a bounded output buffer.
 
-    - Accumulates stdout/stderr into an internal queue
-    - release() returns accumulated output and clears the queue
+    - Accumulates raw stdout/stderr lines into an internal ring buffer; bytes
+      are decoded only when released
+    - release() returns accumulated output and clears the buffer
     - send(data) writes raw data to stdin (no newline automatically)
     - Detects attach marker lines: 'PWNCLI_ATTACH_RESULT:<json>'
     - Provides a structured event queue for output/state markers
@@ -27,92 +56,159 @@ class PwnPipe:
         env_full = os.environ.copy()
         env_full.update(self.env)
 
-        self.proc = subprocess.Popen(
-            command,
-            cwd=self.cwd,
-            shell=True,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            bufsize=1,
-            universal_newlines=True,
-            env=env_full,
-        )
-        self._q: "queue.Queue[str]" = queue.Queue()
-        self._events: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self.proc = self._spawn(command, env_full)
+        # Non-blocking so a driver that never reads stdin cannot wedge send()
+        assert self.proc.stdin is not None
+        self._stdin_fd = self.proc.stdin.fileno()
+        os.set_blocking(self._stdin_fd, False)
+        self._q: Deque[bytes] = deque(maxlen=MAX_BUFFERED_LINES)
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=MAX_BUFFERED_EVENTS)
         self._alive = True
         self._lock = threading.Lock()
         self._attach_result = None
         self._exit_code: Optional[int] = None
 
-        self._attach_event = threading.Event()
-        self._output_event = threading.Event()
-        self._exit_event = threading.Event()
-        self._activity_event = threading.Event()
+        # _F_* bits guarded by _lock; _activity wakes wait_ready() once any is set
+        self._flags = 0
+        self._activity = threading.Event()
 
-        self._t_out = threading.Thread(
-            target=self._reader, args=(self.proc.stdout, "out")
-        )
-        self._t_err = threading.Thread(
-            target=self._reader, args=(self.proc.stderr, "err")
-        )
-        self._t_out.daemon = True
-        self._t_err.daemon = True
-        self._t_out.start()
-        self._t_err.start()
+        self._t_read = threading.Thread(target=self._reader)
+        self._t_read.daemon = True
+        self._t_read.start()
 
         self._t_wait = threading.Thread(target=self._waiter)
         self._t_wait.daemon = True
         self._t_wait.start()
 
-    def _reader(self, pipe, stream: str):
-        for line in iter(pipe.readline, ""):
-            if line.startswith("PWNCLI_ATTACH_RESULT:"):
-                payload = line.split(":", 1)[1].strip()
+    def _spawn(self, command: str, env: Dict[str, str]) -> subprocess.Popen:
+        argv = None
+        if not _SHELL_CHARS.intersection(command):
+            try:
+                argv = shlex.split(command)
+            except ValueError:
+                pass
+        # Leading VAR=value assignments are shell syntax too
+        use_shell = not argv or "=" in argv[0]
+        kwargs: Dict[str, Any] = dict(
+            cwd=self.cwd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            # Unbuffered: the reader uses os.read() on the fds and send()
+            # writes straight through, so the io buffers would go unused.
+            bufsize=0,
+            env=env,
+        )
+        if not use_shell:
+            assert argv is not None
+            try:
+                return subprocess.Popen(argv, **kwargs)
+            except FileNotFoundError:
+                # Let the shell report it (exit 127) as it did before
+                pass
+        return subprocess.Popen(command, shell=True, **kwargs)
+
+    def _signal(self):
+        # The event is never cleared, so after the first signal there is
+        # nothing to wake; skip Event.set() and its condition lock.
+        if not self._activity.is_set():
+            self._activity.set()
+
+    def _reader(self):
+        # One thread multiplexes stdout and stderr, reading whatever is
+        # available in large chunks and splitting complete lines out of it.
+        assert self.proc.stdout is not None and self.proc.stderr is not None
+        streams = {self.proc.stdout.fileno(): "out", self.proc.stderr.fileno(): "err"}
+        pending = {fd: bytearray() for fd in streams}
+        with selectors.DefaultSelector() as selector:
+            for fd in streams:
+                selector.register(fd, selectors.EVENT_READ)
+            while selector.get_map():
+                for key, _ in selector.select():
+                    fd = key.fd
+                    chunk = os.read(fd, READ_CHUNK_SIZE)
+                    buf = pending[fd]
+                    if not chunk:
+                        selector.unregister(fd)
+                        if buf:
+                            self._handle_lines([bytes(buf)], streams[fd])
+                        continue
+                    buf += chunk
+                    end = buf.rfind(b"\n") + 1
+                    if not end:
+                        continue
+                    data = bytes(buf[:end])
+                    del buf[:end]
+                    lines = []
+                    start = 0
+                    while start < end:
+                        nl = data.index(b"\n", start) + 1
+                        lines.append(data[start:nl])
+                        start = nl
+                    self._handle_lines(lines, streams[fd])
+        self.proc.stdout.close()
+        self.proc.stderr.close()
+
+    def _handle_lines(self, lines: List[bytes], stream: str):
+        # Classify the whole chunk first, then publish it with one lock hold
+        out: List[bytes] = []
+        events: List[Dict[str, Any]] = []
+        attach_result = None
+        attached = False
+        output = False
+        for line in lines:
+            if line.startswith(_ATTACH_PREFIX):
                 try:
-                    with self._lock:
-                        self._attach_result = json.loads(payload)
-                    self._attach_event.set()
-                    self._activity_event.set()
-                    self._events.put(
-                        {
-                            "type": "attached",
-                            "ok": bool(
-                                self._attach_result.get("successful")
-                                if isinstance(self._attach_result, dict)
-                                else False
-                            ),
-                            "result": self._attach_result,
-                        }
-                    )
+                    attach_result = load_json(line[_ATTACH_LEN:].strip())
                 except Exception:
-                    pass
+                    continue
+                attached = True
+                events.append(
+                    {
+                        "type": "attached",
+                        "ok": bool(
+                            attach_result.get("successful")
+                            if isinstance(attach_result, dict)
+                            else False
+                        ),
+                        "result": attach_result,
+                    }
+                )
                 continue
-            if line.startswith("PWNO_IPC:"):
-                payload = line.split(":", 1)[1].strip()
+            if line.startswith(_IPC_PREFIX):
                 try:
-                    event = json.loads(payload)
-                    if isinstance(event, dict):
-                        self._events.put(event)
-                        self._output_event.set()
-                        self._activity_event.set()
-                        continue
+                    event = load_json(line[_IPC_LEN:].strip())
                 except Exception:
-                    pass
-            self._q.put(line)
-            self._events.put({"type": stream, "data": line})
-            self._output_event.set()
-            self._activity_event.set()
-        pipe.close()
+                    event = None
+                if isinstance(event, dict):
+                    events.append(event)
+                    output = True
+                    continue
+            out.append(line)
+            events.append({"type": stream, "data": line})
+            output = True
+        with self._lock:
+            if attached:
+                self._attach_result = attach_result
+                self._flags |= _F_ATTACH
+            if output:
+                self._flags |= _F_OUTPUT
+            self._q.extend(out)
+            self._events.extend(events)
+        if attached or output:
+            self._signal()
 
     def _waiter(self):
         self.proc.wait()
+        # Let the reader publish the final output before the exit event; a
+        # grandchild still holding the pipes must not delay it for long.
+        self._t_read.join(timeout=EXIT_DRAIN_TIMEOUT_SEC)
         with self._lock:
             self._alive = False
             self._exit_code = self.proc.returncode
-        self._exit_event.set()
-        self._activity_event.set()
-        self._events.put({"type": "exit", "code": self._exit_code})
+            self._events.append({"type": "exit", "code": self._exit_code})
+            self._flags |= _F_EXIT
+        self._signal()
 
     def is_alive(self) -> bool:
         with self._lock:
@@ -122,30 +218,33 @@ class PwnPipe:
         if not self.is_alive():
             return False
         try:
-            assert self.proc.stdin is not None
-            self.proc.stdin.write(data)
-            self.proc.stdin.flush()
+            view = memoryview(data.encode("utf-8"))
+            deadline = time.monotonic() + SEND_TIMEOUT_SEC
+            while view:
+                try:
+                    view = view[os.write(self._stdin_fd, view) :]
+                except BlockingIOError:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    select.select([], [self._stdin_fd], [], remaining)
             return True
         except Exception:
             return False
 
     def release(self) -> str:
-        chunks = []
-        try:
-            while True:
-                chunks.append(self._q.get_nowait())
-        except queue.Empty:
-            pass
-        return "".join(chunks)
+        with self._lock:
+            lines, self._q = self._q, deque(maxlen=MAX_BUFFERED_LINES)
+        return b"".join(lines).decode("utf-8", "replace")
 
     def release_events(self) -> List[Dict[str, Any]]:
-        events: List[Dict[str, Any]] = []
-        try:
-            while True:
-                events.append(self._events.get_nowait())
-        except queue.Empty:
-            pass
-        return events
+        with self._lock:
+            events, self._events = self._events, deque(maxlen=MAX_BUFFERED_EVENTS)
+        for event in events:
+            data = event.get("data")
+            if isinstance(data, bytes):
+                event["data"] = data.decode("utf-8", "replace")
+        return list(events)
 
     def get_attach_result(self):
         with self._lock:
@@ -163,21 +262,16 @@ class PwnPipe:
 
     def wait_ready(self, timeout: float = 3.0) -> Dict[str, Any]:
         start = time.monotonic()
-        if self._attach_event.is_set():
-            reason = "attached"
-        elif self._output_event.is_set():
-            reason = "output"
-        elif self._exit_event.is_set():
-            reason = "exited"
+        if not self._activity.wait(timeout):
+            reason = "timeout"
         else:
-            signaled = self._activity_event.wait(timeout)
-            if not signaled:
-                reason = "timeout"
-            elif self._attach_event.is_set():
+            with self._lock:
+                flags = self._flags
+            if flags & _F_ATTACH:
                 reason = "attached"
-            elif self._output_event.is_set():
+            elif flags & _F_OUTPUT:
                 reason = "output"
-            elif self._exit_event.is_set():
+            elif flags & _F_EXIT:
                 reason = "exited"
             else:
                 reason = "activity"
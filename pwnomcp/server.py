@@ -1,4 +1,3 @@
-import logging
 from typing import Optional
 
 from fastmcp import FastMCP
@@ -8,11 +7,6 @@ from pwnomcp.lifespan import create_lifespan
 from pwnomcp.services import AppServices
 from pwnomcp.tools import register_all_tools
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
-
 
 def create_mcp(services: Optional[AppServices] = None) -> FastMCP:
     mcp = FastMCP(
@@ -31,15 +31,16 @@ class AppServices:
 
 
 def create_services(workspace_root: str = DEFAULT_WORKSPACE) -> AppServices:
-    if not os.path.exists(workspace_root):
-        try:
-            os.makedirs(workspace_root, exist_ok=True)
-            logger.info("Created default workspace directory: %s", workspace_root)
-        except OSError as exc:
-            logger.warning(
-                "Could not create workspace directory %s: %s", workspace_root, exc
-            )
-            logger.info("Continuing without default workspace directory")
+    try:
+        os.makedirs(workspace_root)
+        logger.info("Created default workspace directory: %s", workspace_root)
+    except FileExistsError:
+        pass
+    except OSError as exc:
+        logger.warning(
+            "Could not create workspace directory %s: %s", workspace_root, exc
+        )
+        logger.info("Continuing without default workspace directory")
 
     runtime_paths = build_runtime_paths(workspace_root)
     session_registry = DebugSessionRegistry(runtime_paths)
@@ -48,8 +49,10 @@ def create_services(workspace_root: str = DEFAULT_WORKSPACE) -> AppServices:
     init_result = default_session.gdb.initialize()
     logger.info("GDB initialization: %s", init_result.get("status"))
 
-    retdec_analyzer = RetDecAnalyzer()
-    logger.info("RetDec analyzer created (lazy initialization)")
+    retdec_analyzer = RetDecAnalyzer(
+        cache_dir=os.path.join(runtime_paths.runtime_root, "retdec")
+    )
+    logger.info("RetDec analyzer created")
 
     return AppServices(
         runtime_paths=runtime_paths,
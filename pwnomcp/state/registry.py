@@ -66,31 +66,38 @@ class DebugSessionRegistry:
 
     def create_session(self, session_id: Optional[str] = None) -> DebugSession:
         """Create (or return existing) debugger session by id."""
+        chosen_id = (
+            sanitize_session_id(session_id) if session_id else self._new_session_id()
+        )
         with self._lock:
-            chosen_id = (
-                sanitize_session_id(session_id)
-                if session_id
-                else self._new_session_id()
-            )
             if chosen_id in self.sessions:
                 return self.sessions[chosen_id]
 
-            runtime_dir = self._runtime_dir_for(chosen_id)
-            gdb = GdbController()
-            state = SessionState(session_id=chosen_id)
-            tools = PwndbgTools(gdb, state)
-            session = DebugSession(
-                session_id=chosen_id,
-                runtime_dir=runtime_dir,
-                gdb=gdb,
-                state=state,
-                tools=tools,
-            )
-            self.sessions[chosen_id] = session
-            if self.default_session_id is None:
-                self.default_session_id = chosen_id
-            logger.info("Created debug session '%s'", chosen_id)
-            return session
+        # GDB startup makes MI round trips; build it without blocking lookups
+        runtime_dir = self._runtime_dir_for(chosen_id)
+        gdb = GdbController()
+        state = SessionState(session_id=chosen_id)
+        tools = PwndbgTools(gdb, state)
+        session = DebugSession(
+            session_id=chosen_id,
+            runtime_dir=runtime_dir,
+            gdb=gdb,
+            state=state,
+            tools=tools,
+        )
+
+        with self._lock:
+            existing = self.sessions.get(chosen_id)
+            if existing is None:
+                self.sessions[chosen_id] = session
+                if self.default_session_id is None:
+                    self.default_session_id = chosen_id
+        if existing is not None:
+            # Lost a race with a concurrent create for the same id
+            self._close_gdb(chosen_id, session)
+            return existing
+        logger.info("Created debug session '%s'", chosen_id)
+        return session
 
     def get_session(self, session_id: str) -> Optional[DebugSession]:
         lookup_id = sanitize_session_id(session_id)
@@ -102,42 +109,48 @@ class DebugSessionRegistry:
         with self._lock:
             if session_id:
                 existing = self.sessions.get(session_id)
-                if existing:
-                    return existing
-                return self.create_session(session_id)
-
-            if self.default_session_id and self.default_session_id in self.sessions:
-                return self.sessions[self.default_session_id]
-            return self.create_session("default")
+            elif self.default_session_id:
+                existing = self.sessions.get(self.default_session_id)
+            else:
+                existing = None
+        if existing:
+            return existing
+        return self.create_session(session_id or "default")
 
     def list_sessions(self) -> List[Dict[str, Any]]:
         with self._lock:
             return [session.to_dict() for session in self.sessions.values()]
 
+    def _close_gdb(self, session_id: str, session: DebugSession) -> None:
+        try:
+            session.gdb.close()
+        except Exception:
+            logger.exception("Failed to close gdb for session '%s'", session_id)
+
     def close_session(self, session_id: str) -> Dict[str, Any]:
         """Close a session and release associated resources."""
         lookup_id = sanitize_session_id(session_id)
         with self._lock:
             session = self.sessions.pop(lookup_id, None)
-            if not session:
-                return {
-                    "success": False,
-                    "error": f"Session '{lookup_id}' not found",
-                }
-
-            try:
-                session.gdb.close()
-            except Exception:
-                logger.exception("Failed to close gdb for session '%s'", lookup_id)
-
-            if self.default_session_id == lookup_id:
+            if session and self.default_session_id == lookup_id:
                 self.default_session_id = next(iter(self.sessions), None)
+        if not session:
+            return {
+                "success": False,
+                "error": f"Session '{lookup_id}' not found",
+            }
 
-            logger.info("Closed debug session '%s'", lookup_id)
-            return {"success": True, "session_id": lookup_id}
+        # Closed outside the lock so other sessions stay reachable meanwhile
+        self._close_gdb(lookup_id, session)
+        logger.info("Closed debug session '%s'", lookup_id)
+        return {"success": True, "session_id": lookup_id}
 
     def close_all(self) -> None:
         """Close all tracked sessions."""
         with self._lock:
-            for session_id in list(self.sessions.keys()):
-                self.close_session(session_id)
+            sessions = list(self.sessions.items())
+            self.sessions.clear()
+            self.default_session_id = None
+        for session_id, session in sessions:
+            self._close_gdb(session_id, session)
+            logger.info("Closed debug session '%s'", session_id)
@@ -67,14 +67,14 @@ class SessionState:
         """Add a new breakpoint"""
         bp = Breakpoint(number=number, address=address, condition=condition)
         self.breakpoints[number] = bp
-        logger.info(f"Added breakpoint #{number} at {address}")
+        logger.info("Added breakpoint #%s at %s", number, address)
         return bp
 
     def remove_breakpoint(self, number: int) -> bool:
         """Remove a breakpoint by number"""
         if number in self.breakpoints:
             del self.breakpoints[number]
-            logger.info(f"Removed breakpoint #{number}")
+            logger.info("Removed breakpoint #%s", number)
             return True
         return False
 
@@ -83,7 +83,7 @@ class SessionState:
         if number in self.breakpoints:
             self.breakpoints[number].enabled = not self.breakpoints[number].enabled
             state = "enabled" if self.breakpoints[number].enabled else "disabled"
-            logger.info(f"Breakpoint #{number} {state}")
+            logger.info("Breakpoint #%s %s", number, state)
             return True
         return False
 
@@ -91,7 +91,7 @@ class SessionState:
         """Add a memory watch"""
         watch = Watch(address=address, size=size, format=format)
         self.watches.append(watch)
-        logger.info(f"Added watch for {address} ({size} bytes, {format})")
+        logger.info("Added watch for %s (%s bytes, %s)", address, size, format)
         return watch
 
     def remove_watch(self, address: str) -> bool:
@@ -99,7 +99,7 @@ class SessionState:
         for i, watch in enumerate(self.watches):
             if watch.address == address:
                 self.watches.pop(i)
-                logger.info(f"Removed watch for {address}")
+                logger.info("Removed watch for %s", address)
                 return True
         return False
 
@@ -111,7 +111,7 @@ class SessionState:
         """Update the process state"""
         old_state = self.state
         self.state = new_state
-        logger.debug(f"State transition: {old_state} -> {new_state}")
+        logger.debug("State transition: %s -> %s", old_state, new_state)
 
     def clear(self):
         """Clear session state for a new debugging session"""
@@ -1,18 +1,45 @@
 """FastMCP tool registration package."""
 
+import logging
+import os
+from typing import Set
+
 from fastmcp import FastMCP
 
+logger = logging.getLogger(__name__)
+
+
+def _disabled_groups() -> Set[str]:
+    value = os.environ.get("PWNO_MCP_DISABLE_TOOLS", "")
+    return {name.strip() for name in value.split(",") if name.strip()}
+
 
 def register_all_tools(mcp: FastMCP) -> None:
-    from . import debug, inspect, processes, pwncli, python_env, repos, retdec
-
-    debug.register(mcp)
-    inspect.register(mcp)
-    processes.register(mcp)
-    repos.register(mcp)
-    python_env.register(mcp)
-    pwncli.register(mcp)
-    retdec.register(mcp)
+    from . import batch, debug, inspect, processes, pwncli, python_env, repos, retdec
+
+    # Registration order is the order tools are listed to clients
+    groups = {
+        "debug": debug,
+        "batch": batch,
+        "inspect": inspect,
+        "processes": processes,
+        "repos": repos,
+        "python_env": python_env,
+        "pwncli": pwncli,
+        "retdec": retdec,
+    }
+    disabled = _disabled_groups()
+    unknown = disabled - groups.keys()
+    if unknown:
+        logger.warning(
+            "Ignoring unknown tool groups in PWNO_MCP_DISABLE_TOOLS: %s",
+            ", ".join(sorted(unknown)),
+        )
+    for name, module in groups.items():
+        if name in disabled:
+            logger.info("Tool group %s disabled", name)
+            continue
+        module.register(mcp)
 
 
 __all__ = ["register_all_tools"]
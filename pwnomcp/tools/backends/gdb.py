@@ -7,14 +7,37 @@ immediate responses suitable for LLM interaction.
 """
 
 import logging
+import threading
 import time
 from typing import List, Dict, Optional, Any, Tuple
-from pathlib import Path
 from pygdbmi import gdbcontroller
 import os
 
+from pwnomcp.utils.format import tabularize
+
 logger = logging.getLogger(__name__)
 
+GDB_COMMAND_TIMEOUT_SEC = 7.0
+# pygdbmi keeps reading until output has been quiet for this long; completion
+# is detected from the tokenized result record, so this only needs to batch
+# records that arrive back to back.
+GDB_OUTPUT_SETTLE_SEC = 0.01
+# Quiet period used to pick up the *stopped record that follows ^running
+GDB_RUNNING_SETTLE_SEC = 0.2
+
+
+def _tabularize_payload(result: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """Tabularize the ``key`` list in the MI result records of ``result``."""
+    for response in result.get("responses", []):
+        payload = response.get("payload")
+        if (
+            response.get("type") == "result"
+            and isinstance(payload, dict)
+            and isinstance(payload.get(key), list)
+        ):
+            payload[key] = tabularize(payload[key])
+    return result
+
 
 class GdbController:
     """Manages GDB instance and command execution via Machine Interface"""
@@ -27,15 +50,22 @@ class GdbController:
             gdb_path: Path to GDB executable (default: "gdb")
         """
         self.controller = gdbcontroller.GdbController(
-            command=[pwnodbg, "--interpreter=mi3", "--quiet"]
+            command=[pwnodbg, "--interpreter=mi3", "--quiet"],
+            time_to_check_for_additional_output_sec=GDB_OUTPUT_SETTLE_SEC,
         )
         self._initialized = False
+        self._next_token = 1
+        # Serializes write + read so one caller cannot consume another's records
+        self._command_lock = threading.RLock()
         self._inferior_pid: Optional[int] = None
         self._state = "idle"  # idle, running, stopped, exited
 
     def initialize(self) -> Dict[str, Any]:
         """
-        Initialize GDB with pwndbg from ~/.gdbinit
+        Apply the MI settings used for non-interactive sessions.
+
+        The pwndbg launcher loads its own init scripts, so ~/.gdbinit is not
+        sourced (or stat'ed) here.
 
         Returns:
             Dictionary with initialization status and messages
@@ -45,15 +75,6 @@ class GdbController:
 
         results = []
 
-        # Load .gdbinit if it exists
-        # gdbinit = Path.home() / ".gdbinit"
-        # if gdbinit.exists():
-        #     logger.info(f"Loading .gdbinit from {gdbinit}")
-        #     response = self.execute_command(f"source {gdbinit}")
-        #     results.append(response)
-        # else:
-        #     logger.warning("No .gdbinit found")
-
         # Core GDB settings via MI (-gdb-set) for reliable, fast non-interactive behavior
         for setting in [
             "-gdb-set mi-async on",
@@ -63,7 +84,9 @@ class GdbController:
             "-gdb-set follow-fork-mode parent",
             "-gdb-set follow-exec-mode same",
         ]:
-            results.append(self.execute_mi_command(setting))
+            results.append(
+                {"command": setting, "success": self._execute_internal(setting)}
+            )
 
         # Ensure pwndbg is active (optional; comment out if too slow in your env)
         # pwndbg_check = self.execute_command("pwndbg")
@@ -72,44 +95,114 @@ class GdbController:
         self._initialized = True
         return {"status": "initialized", "messages": results}
 
-    def execute_mi_command(self, command: str) -> Dict[str, Any]:
-        """Execute a GDB/MI command and return raw MI responses."""
-        logger.debug(f"Executing MI command: {command}")
-        responses = self.controller.write(command, timeout_sec=7.0)
-        # Update internal state from notify messages and detect errors
+    def _execute_internal(self, command: str) -> bool:
+        """Execute a setup command whose output is discarded by design.
+
+        Only notifications are processed (to keep the tracked state accurate);
+        the raw responses are not collected into a result payload.
+        """
+        token, responses = self._write_command(command)
+        completed, error_found = self._process_responses(token, responses)
+        return completed and not error_found
+
+    def _write_command(self, command: str) -> Tuple[int, List[Dict[str, Any]]]:
+        """Write a token-prefixed command and read until its result record.
+
+        GDB echoes the numeric token on the ``^done``/``^error``/``^running``
+        record, so completion is detected from that record instead of waiting
+        for the output stream to go quiet.
+        """
+        with self._command_lock:
+            token = self._next_token
+            self._next_token += 1
+            self.controller.write(f"{token}{command}", read_response=False)
+
+            deadline = time.monotonic() + GDB_COMMAND_TIMEOUT_SEC
+            responses: List[Dict[str, Any]] = []
+            result_message: Optional[str] = None
+            while result_message is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                batch = self._get_async_responses(timeout_sec=remaining)
+                responses.extend(batch)
+                for response in batch:
+                    if (
+                        response.get("type") == "result"
+                        and response.get("token") == token
+                    ):
+                        result_message = response.get("message")
+
+            if result_message == "running":
+                # Execution commands report ^running first; keep reading briefly
+                # so a quick *stopped (step/next/short continue) lands here too.
+                responses.extend(self._read_until_stopped(deadline))
+            return token, responses
+
+    def _read_until_stopped(self, deadline: float) -> List[Dict[str, Any]]:
+        responses: List[Dict[str, Any]] = []
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            batch = self._get_async_responses(
+                timeout_sec=min(GDB_RUNNING_SETTLE_SEC, remaining)
+            )
+            if not batch:
+                break
+            responses.extend(batch)
+            if any(
+                response.get("type") == "notify"
+                and response.get("message") == "stopped"
+                for response in batch
+            ):
+                break
+        return responses
+
+    def _process_responses(
+        self, token: int, responses: List[Dict[str, Any]]
+    ) -> Tuple[bool, bool]:
+        """Track state from notifications.
+
+        Returns:
+            (completed, error_found) for the result record matching ``token``.
+        """
+        completed = False
         error_found = False
         for response in responses:
-            if response.get("type") == "notify":
+            response_type = response.get("type")
+            if response_type == "notify":
                 self._handle_notify(response)
-            elif (
-                response.get("type") == "result" and response.get("message") == "error"
-            ):
-                error_found = True
-        return {
+            elif response_type == "result" and response.get("token") == token:
+                completed = True
+                error_found = response.get("message") == "error"
+        return completed, error_found
+
+    def _execute(self, command: str) -> Dict[str, Any]:
+        token, responses = self._write_command(command)
+        completed, error_found = self._process_responses(token, responses)
+        result = {
             "command": command,
             "responses": responses,
-            "success": not error_found,
+            "success": completed and not error_found,
             "state": self._state,
         }
+        if not completed:
+            result["error"] = (
+                f"Timed out after {GDB_COMMAND_TIMEOUT_SEC}s waiting for GDB to "
+                f"complete '{command}'"
+            )
+        return result
+
+    def execute_mi_command(self, command: str) -> Dict[str, Any]:
+        """Execute a GDB/MI command and return raw MI responses."""
+        logger.debug("Executing MI command: %s", command)
+        return self._execute(command)
 
     def execute_command(self, command: str) -> Dict[str, Any]:
         """Execute a classic GDB command (non-MI) and return raw responses."""
-        logger.debug(f"Executing command: {command}")
-        responses = self.controller.write(command, timeout_sec=7.0)
-        error_found = False
-        for response in responses:
-            if response.get("type") == "notify":
-                self._handle_notify(response)
-            elif (
-                response.get("type") == "result" and response.get("message") == "error"
-            ):
-                error_found = True
-        return {
-            "command": command,
-            "responses": responses,
-            "success": not error_found,
-            "state": self._state,
-        }
+        logger.debug("Executing command: %s", command)
+        return self._execute(command)
 
     def _handle_notify(self, response: Dict[str, Any]):
         """Handle GDB notification messages to track state"""
@@ -124,7 +217,7 @@ class GdbController:
             payload = response.get("payload", {})
             # Extract stop reason if available
             reason = payload.get("reason", "unknown")
-            logger.debug(f"Inferior state: STOPPED (reason: {reason})")
+            logger.debug("Inferior state: STOPPED (reason: %s)", reason)
 
         elif message == "thread-group-exited":
             self._state = "exited"
@@ -135,7 +228,7 @@ class GdbController:
             # This happens when attaching to a process
             payload = response.get("payload", {})
             self._inferior_pid = payload.get("pid")
-            logger.debug(f"Thread group started, PID: {self._inferior_pid}")
+            logger.debug("Thread group started, PID: %s", self._inferior_pid)
 
     def _get_async_responses(self, timeout_sec: float) -> List[Dict[str, Any]]:
         getter = getattr(self.controller, "get_gdb_response", None)
@@ -166,26 +259,27 @@ class GdbController:
 
         start = time.monotonic()
         first = True
-        for _ in range(max_rounds):
-            if first:
-                remaining = max(0.0, timeout_sec - (time.monotonic() - start))
-                batch = self._get_async_responses(timeout_sec=remaining)
-                first = False
-            else:
-                batch = self._get_async_responses(timeout_sec=0.0)
-
-            if not batch:
-                break
-
-            for response in batch:
-                if response.get("type") == "notify":
-                    self._handle_notify(response)
-                elif (
-                    response.get("type") == "result"
-                    and response.get("message") == "error"
-                ):
-                    error_found = True
-            responses.extend(batch)
+        with self._command_lock:
+            for _ in range(max_rounds):
+                if first:
+                    remaining = max(0.0, timeout_sec - (time.monotonic() - start))
+                    batch = self._get_async_responses(timeout_sec=remaining)
+                    first = False
+                else:
+                    batch = self._get_async_responses(timeout_sec=0.0)
+
+                if not batch:
+                    break
+
+                for response in batch:
+                    if response.get("type") == "notify":
+                        self._handle_notify(response)
+                    elif (
+                        response.get("type") == "result"
+                        and response.get("message") == "error"
+                    ):
+                        error_found = True
+                responses.extend(batch)
 
         return {
             "responses": responses,
@@ -280,14 +374,15 @@ class GdbController:
                 "state": self._state,
                 "error": f"Cannot get context while inferior is {self._state}",
             }
-        # Return a structured payload with MI results for key views
+        # Return a structured payload with MI results for key views; the
+        # per-register and per-instruction lists become columns/rows tables.
         return {
             "success": True,
             "state": self._state,
             "contexts": {
-                "regs": self.get_registers_mi(),
+                "regs": _tabularize_payload(self.get_registers_mi(), "register-values"),
                 "backtrace": self.get_backtrace_mi(),
-                "disasm": self.get_disassembly_mi(),
+                "disasm": _tabularize_payload(self.get_disassembly_mi(), "asm_insns"),
             },
         }
 
@@ -7,13 +7,17 @@ Useful for analyzing specific vulnerable versions of software or libraries.
 
 import logging
 import os
+import re
 import shutil
 import tempfile
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import subprocess
 
 logger = logging.getLogger(__name__)
 
+# Full SHA-1/SHA-256 object names; only these refs are immutable enough to reuse
+_COMMIT_HASH = re.compile(r"[0-9a-f]{40}|[0-9a-f]{64}")
+
 
 class GitTools:
     """Tools for git repository operations"""
@@ -28,7 +32,10 @@ class GitTools:
             tempfile.gettempdir(), "pwno", "repos"
         )
         os.makedirs(self.workspace_dir, exist_ok=True)
-        logger.info(f"Git workspace initialized at: {self.workspace_dir}")
+        # Successful fetches of commit hashes keyed by
+        # (repo_url, version, repo_path, shallow)
+        self._fetched: Dict[Tuple[str, str, str, bool], Dict[str, Any]] = {}
+        logger.info("Git workspace initialized at: %s", self.workspace_dir)
 
     def fetch_repo(
         self,
@@ -61,9 +68,21 @@ class GitTools:
                 else os.path.join(self.workspace_dir, target_dir)
             )
 
+            # Reuse a previous fetch of the same commit into the same place,
+            # as long as the checkout has not been modified since
+            cache_key = None
+            if version and _COMMIT_HASH.fullmatch(version):
+                cache_key = (repo_url, version, repo_path, shallow)
+            cached = self._fetched.get(cache_key) if cache_key else None
+            if cached is not None and self._is_pristine(
+                repo_path, cached["current_commit"]
+            ):
+                logger.info("Reusing previous fetch of %s at %s", repo_url, repo_path)
+                return {**cached, "cached": True}
+
             # Check if repo already exists
             if os.path.exists(repo_path):
-                logger.info(f"Repository already exists at {repo_path}, removing...")
+                logger.info("Repository already exists at %s, removing...", repo_path)
                 shutil.rmtree(repo_path)
 
             # Clone the repository
@@ -74,7 +93,7 @@ class GitTools:
 
             clone_cmd.extend([repo_url, repo_path])
 
-            logger.info(f"Cloning repository: {repo_url}")
+            logger.info("Cloning repository: %s", repo_url)
             result = subprocess.run(
                 clone_cmd,
                 capture_output=True,
@@ -93,7 +112,7 @@ class GitTools:
             # Checkout specific version if requested
             checkout_info = None
             if version:
-                logger.info(f"Checking out version: {version}")
+                logger.info("Checking out version: %s", version)
 
                 # First, fetch the specific ref if needed
                 fetch_result = subprocess.run(
@@ -157,7 +176,7 @@ class GitTools:
                 else "unknown"
             )
 
-            return {
+            fetched = {
                 "success": True,
                 "path": repo_path,
                 "repo_url": repo_url,
@@ -167,19 +186,44 @@ class GitTools:
                 "checkout_info": checkout_info,
                 "workspace": self.workspace_dir,
             }
+            if cache_key and current_commit == version:
+                self._fetched[cache_key] = fetched
+            return {**fetched, "cached": False}
 
         except subprocess.TimeoutExpired:
             return {"success": False, "error": "Operation timed out", "timeout": 300}
         except Exception as e:
-            logger.error(f"Git fetch error: {str(e)}")
+            logger.error("Git fetch error: %s", e)
             return {"success": False, "error": str(e), "type": type(e).__name__}
 
+    @staticmethod
+    def _is_pristine(repo_path: str, commit: str) -> bool:
+        """Whether repo_path is still a clean checkout of commit."""
+        if not os.path.isdir(repo_path):
+            return False
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+        )
+        if head.returncode != 0 or head.stdout.strip() != commit:
+            return False
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--ignored"],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+        )
+        return status.returncode == 0 and not status.stdout.strip()
+
     def cleanup_workspace(self) -> Dict[str, Any]:
         """
         Clean up the git workspace directory.
 
         :returns: Dictionary with cleanup status
         """
+        self._fetched.clear()
         try:
             if os.path.exists(self.workspace_dir):
                 shutil.rmtree(self.workspace_dir)
@@ -196,5 +240,5 @@ class GitTools:
                     "path": self.workspace_dir,
                 }
         except Exception as e:
-            logger.error(f"Cleanup error: {str(e)}")
+            logger.error("Cleanup error: %s", e)
             return {"success": False, "error": str(e)}
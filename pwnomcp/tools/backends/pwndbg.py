@@ -5,14 +5,38 @@ Provides MCP tool implementations for GDB/pwndbg commands.
 Each tool returns immediate results suitable for LLM interaction.
 """
 
+import base64
 import logging
-from typing import Dict, Any, Optional, List, Tuple
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Any, Optional, List, Tuple
 
 from pwnomcp.tools.backends.gdb import GdbController
 from pwnomcp.state.session import SessionState
 
 logger = logging.getLogger(__name__)
 
+# get_context/get_memory results are reused for this long while the inferior
+# stays stopped and no other tool call has run against the session.
+READ_CACHE_TTL_SEC = 0.5
+# Least recently used entries are evicted beyond this many distinct reads
+READ_CACHE_MAX_ENTRIES = 32
+
+# step_control aliases -> (canonical name, GdbController method name). Names
+# are looked up on the controller instance so overrides and test doubles apply.
+STEP_COMMANDS: Dict[str, Tuple[str, str]] = {
+    "c": ("continue", "continue_execution"),
+    "continue": ("continue", "continue_execution"),
+    "n": ("next", "next"),
+    "next": ("next", "next"),
+    "s": ("step", "step"),
+    "step": ("step", "step"),
+    "ni": ("nexti", "nexti"),
+    "nexti": ("nexti", "nexti"),
+    "si": ("stepi", "stepi"),
+    "stepi": ("stepi", "stepi"),
+}
+
 
 class PwndbgTools:
     """MCP tools for pwndbg interaction"""
@@ -27,6 +51,9 @@ class PwndbgTools:
         """
         self.gdb = gdb_controller
         self.session = session_state
+        self._read_cache: OrderedDict[
+            Tuple[Any, ...], Tuple[float, Dict[str, Any]]
+        ] = OrderedDict()
         # Ensure GDB is initialized once lazily to avoid startup cost unless used
         try:
             self.gdb.initialize()
@@ -38,43 +65,40 @@ class PwndbgTools:
 
     def execute(self, command: str) -> Dict[str, Any]:
         """Execute arbitrary GDB/pwndbg command and return raw responses"""
-        logger.info(f"Execute tool: {command}")
+        self._read_cache.clear()
+        logger.info("Execute tool: %s", command)
         self.gdb.initialize()
         result = self.gdb.execute_command(command)
         self.session.update_state(result["state"])
-        self.session.record_command(command, result)
         return result
 
     def set_file(self, binary_path: str) -> Dict[str, Any]:
         """Set the file to debug; return raw responses"""
-        logger.info(f"Set file: {binary_path}")
+        self._read_cache.clear()
+        logger.info("Set file: %s", binary_path)
         self.gdb.initialize()
         result = self.gdb.set_file(binary_path)
         if result.get("success"):
             self.session.binary_path = binary_path
             self.session.binary_loaded = True
         self.session.update_state(result["state"])
-        self.session.record_command(
-            result.get("command", f"-file-exec-and-symbols {binary_path}"), result
-        )
         return result
 
     def attach(self, pid: int) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
         """Attach to an existing process; return raw responses"""
-        logger.info(f"Attach to pid: {pid}")
+        self._read_cache.clear()
+        logger.info("Attach to pid: %s", pid)
         self.gdb.initialize()
         result, context = self.gdb.attach(pid)
         if result.get("success"):
             self.session.pid = pid
         self.session.update_state(result["state"])
-        self.session.record_command(
-            result.get("command", f"-target-attach {pid}"), result
-        )
         return result, context
 
     def run(self, args: str = "", start: bool = False) -> Dict[str, Any]:
         """Run the loaded binary; return raw responses"""
-        logger.info(f"Run with args: '{args}'")
+        self._read_cache.clear()
+        logger.info("Run with args: '%s'", args)
         self.gdb.initialize()
         if not self.session.binary_loaded:
             return {
@@ -86,59 +110,50 @@ class PwndbgTools:
             }
         result = self.gdb.run(args, start=start)
         self.session.update_state(result["state"])
-        self.session.record_command(result.get("command", "-exec-run"), result)
         return result
 
     def finish(self) -> Dict[str, Any]:
         """Run until current function finishes; return raw responses"""
+        self._read_cache.clear()
         logger.info("Finish current function")
         self.gdb.initialize()
         result = self.gdb.finish()
         self.session.update_state(result["state"])
-        self.session.record_command(result.get("command", "-exec-finish"), result)
         return result
 
     def jump(self, locspec: str) -> Dict[str, Any]:
         """Jump to a specific location; return raw responses"""
-        logger.info(f"Jump to {locspec}")
+        self._read_cache.clear()
+        logger.info("Jump to %s", locspec)
         self.gdb.initialize()
         result = self.gdb.jump(locspec)
         self.session.update_state(result["state"])
-        self.session.record_command(
-            result.get("command", f"-exec-jump {locspec}"), result
-        )
         return result
 
     def return_from_function(self) -> Dict[str, Any]:
         """Force return from current function; return raw responses"""
+        self._read_cache.clear()
         logger.info("Force return from current function")
         self.gdb.initialize()
         result = self.gdb.return_from_function()
         self.session.update_state(result["state"])
-        self.session.record_command(result.get("command", "-exec-return"), result)
         return result
 
     def until(self, locspec: Optional[str] = None) -> Dict[str, Any]:
         """Run until a location or next source line; return raw responses"""
-        logger.info(f"Until {locspec if locspec else '[next line]'}")
+        self._read_cache.clear()
+        logger.info("Until %s", locspec if locspec else "[next line]")
         self.gdb.initialize()
         result = self.gdb.until(locspec)
         self.session.update_state(result["state"])
-        self.session.record_command(result.get("command", "-exec-until"), result)
         return result
 
     def step_control(self, command: str) -> Dict[str, Any]:
         """Execute stepping commands (c, n, s, ni, si); return raw responses"""
-        logger.info(f"Step control: {command}")
+        self._read_cache.clear()
+        logger.info("Step control: %s", command)
         self.gdb.initialize()
-        command_map = {
-            "c": "continue",
-            "n": "next",
-            "s": "step",
-            "ni": "nexti",
-            "si": "stepi",
-        }
-        actual = command_map.get(command, command)
+        actual, method = STEP_COMMANDS.get(command, (command, None))
         current_state = self.gdb.get_state()
         if current_state != "stopped":
             return {
@@ -148,17 +163,7 @@ class PwndbgTools:
                 "state": current_state,
                 "error": f"Cannot execute '{command}' in state '{current_state}'",
             }
-        if actual == "continue":
-            result = self.gdb.continue_execution()
-        elif actual == "next":
-            result = self.gdb.next()
-        elif actual == "step":
-            result = self.gdb.step()
-        elif actual == "nexti":
-            result = self.gdb.nexti()
-        elif actual == "stepi":
-            result = self.gdb.stepi()
-        else:
+        if method is None:
             return {
                 "command": actual,
                 "responses": [],
@@ -166,31 +171,50 @@ class PwndbgTools:
                 "state": current_state,
                 "error": f"Unknown step command '{command}'",
             }
+        result = getattr(self.gdb, method)()
         self.session.update_state(result["state"])
-        self.session.record_command(result.get("command", actual), result)
         return result
 
     def gdb_poll(self, timeout: float = 0.0) -> Dict[str, Any]:
         """Drain pending async GDB notifications."""
+        self._read_cache.clear()
         logger.info("GDB poll")
         self.gdb.initialize()
         result = self.gdb.drain_async(timeout_sec=timeout)
         self.session.update_state(result["state"])
-        self.session.record_command("gdb_poll", result)
         return result
 
     def gdb_interrupt(self, timeout: float = 1.0) -> Dict[str, Any]:
         """Interrupt the inferior and drain async notifications."""
+        self._read_cache.clear()
         logger.info("GDB interrupt")
         self.gdb.initialize()
         result = self.gdb.interrupt(timeout_sec=timeout)
         self.session.update_state(result["state"])
-        self.session.record_command("gdb_interrupt", result)
+        return result
+
+    def _cached_read(
+        self, key: Tuple[Any, ...], read: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Serve repeated read-only queries from a short-lived cache while stopped."""
+        if self.gdb.get_state() != "stopped":
+            return read()
+        now = time.monotonic()
+        hit = self._read_cache.get(key)
+        if hit is not None and now - hit[0] < READ_CACHE_TTL_SEC:
+            self._read_cache.move_to_end(key)
+            return dict(hit[1])
+        result = read()
+        if result.get("success", True):
+            self._read_cache[key] = (now, dict(result))
+            self._read_cache.move_to_end(key)
+            while len(self._read_cache) > READ_CACHE_MAX_ENTRIES:
+                self._read_cache.popitem(last=False)
         return result
 
     def get_context(self, context_type: str = "all") -> Dict[str, Any]:
         """Get debugging context (registers, stack, disassembly, etc.)"""
-        logger.info(f"Get context: {context_type}")
+        logger.info("Get context: %s", context_type)
         self.gdb.initialize()
         if self.gdb.get_state() != "stopped":
             return {
@@ -202,51 +226,43 @@ class PwndbgTools:
             }
         if context_type == "all":
             # Prefer fast MI-based snapshot to avoid slow pwndbg rendering
-            aggregated = self.gdb.get_quick_context()
-            self.session.record_command("context all (quick)", aggregated)
-            return aggregated
-        else:
-            result = self.gdb.get_context(context_type)
-            self.session.record_command(f"context {context_type}", result)
-            return result
+            return self._cached_read(("context", "all"), self.gdb.get_quick_context)
+        return self._cached_read(
+            ("context", context_type), lambda: self.gdb.get_context(context_type)
+        )
 
     def set_breakpoint(
         self, location: str, condition: Optional[str] = None
     ) -> Dict[str, Any]:
         """Set a breakpoint; return raw responses"""
-        logger.info(f"Set breakpoint at {location}")
+        self._read_cache.clear()
+        logger.info("Set breakpoint at %s", location)
         result = self.gdb.set_breakpoint(location, condition)
-        self.session.record_command(result.get("command", "-break-insert"), result)
         return result
 
     def list_breakpoints(self) -> Dict[str, Any]:
         """List all breakpoints; return raw responses"""
         logger.info("List breakpoints")
         result = self.gdb.list_breakpoints()
-        self.session.record_command(result.get("command", "-break-list"), result)
         return result
 
     def delete_breakpoint(self, number: int) -> Dict[str, Any]:
         """Delete a breakpoint; return raw responses"""
-        logger.info(f"Delete breakpoint #{number}")
+        self._read_cache.clear()
+        logger.info("Delete breakpoint #%s", number)
         result = self.gdb.delete_breakpoint(number)
-        self.session.record_command(
-            result.get("command", f"-break-delete {number}"), result
-        )
         return result
 
     def toggle_breakpoint(self, number: int, enable: bool) -> Dict[str, Any]:
         """Enable or disable a breakpoint; return raw responses"""
+        self._read_cache.clear()
         action = "enable" if enable else "disable"
-        logger.info(f"{action} breakpoint #{number}")
+        logger.info("%s breakpoint #%s", action, number)
         result = (
             self.gdb.enable_breakpoint(number)
             if enable
             else self.gdb.disable_breakpoint(number)
         )
-        self.session.record_command(
-            result.get("command", f"-break-{action} {number}"), result
-        )
         return result
 
     def _get_full_context(self) -> Dict[str, Any]:
@@ -260,31 +276,39 @@ class PwndbgTools:
         self, address: str, size: int = 64, format: str = "hex"
     ) -> Dict[str, Any]:
         """Read memory at specified address; return raw responses"""
-        logger.info(f"Read memory at {address}, {size} bytes as {format}")
+        logger.info("Read memory at %s, %s bytes as %s", address, size, format)
         self.gdb.initialize()
+        return self._cached_read(
+            ("memory", address, size, format),
+            lambda: self._read_memory(address, size, format),
+        )
+
+    def _read_memory(self, address: str, size: int, format: str) -> Dict[str, Any]:
         if format == "hex":
             # Use fast MI bytes read and return raw bytes; caller can format
+            return self.gdb.read_memory_bytes(address, size)
+        elif format == "base64":
+            # Same MI read, with each block's contents re-encoded as base64
+            # (~1.33x the raw size instead of 2x for hex)
             result = self.gdb.read_memory_bytes(address, size)
-            self.session.record_command(
-                f"-data-read-memory-bytes {address} {size}", result
-            )
+            for response in result.get("responses", []):
+                payload = response.get("payload")
+                if response.get("type") != "result" or not isinstance(payload, dict):
+                    continue
+                for block in payload.get("memory", []):
+                    if "contents" in block:
+                        raw = bytes.fromhex(block["contents"])
+                        block["contents"] = base64.b64encode(raw).decode("ascii")
             return result
         elif format == "string":
             # For C-string, classic command is fine (needs pwndbg/pretty print)
-            cmd = f"x/s {address}"
-            result = self.gdb.execute_command(cmd)
-            self.session.record_command(cmd, result)
-            return result
+            return self.gdb.execute_command(f"x/s {address}")
         else:
             # Generic bytes read via MI grid as fallback
             word_size = 1
             nr_rows = size
             nr_cols = 1
-            result = self.gdb.read_memory_mi(address, "x", word_size, nr_rows, nr_cols)
-            self.session.record_command(
-                f"-data-read-memory {address} x {word_size} {nr_rows} {nr_cols}", result
-            )
-            return result
+            return self.gdb.read_memory_mi(address, "x", word_size, nr_rows, nr_cols)
 
     def get_session_info(self) -> Dict[str, Any]:
         """Get current session information (no GDB sync/parsing)"""
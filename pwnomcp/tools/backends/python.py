@@ -38,7 +38,7 @@ class PythonTools:
         self.scripts_dir = os.path.join(self.workspace_dir, "scripts")
         os.makedirs(self.scripts_dir, exist_ok=True)
         self.venv_path = os.path.join(self.workspace_dir, "shared_venv")
-        logger.info(f"Python workspace initialized at: {self.workspace_dir}")
+        logger.info("Python workspace initialized at: %s", self.workspace_dir)
 
         # Initialize the shared venv
         self._initialize_venv()
@@ -73,10 +73,10 @@ class PythonTools:
                     logger.info("Default packages installed successfully")
                 else:
                     logger.warning(
-                        f"Some packages failed to install: {install_result.stderr}"
+                        "Some packages failed to install: %s", install_result.stderr
                     )
             else:
-                logger.error(f"Failed to create venv: {result.stderr}")
+                logger.error("Failed to create venv: %s", result.stderr)
         else:
             logger.info("Using existing shared Python environment")
 
@@ -103,7 +103,7 @@ class PythonTools:
             if args:
                 cmd.extend(args)
 
-            logger.info(f"Executing Python script: {script_path}")
+            logger.info("Executing Python script: %s", script_path)
 
             # Execute script
             result = subprocess.run(
@@ -128,7 +128,7 @@ class PythonTools:
                 "error": f"Script execution timed out after {timeout} seconds",
             }
         except Exception as e:
-            logger.error(f"Failed to execute script: {e}")
+            logger.error("Failed to execute script: %s", e)
             return {
                 "success": False,
                 "script": script_path,
@@ -165,7 +165,7 @@ class PythonTools:
             return result
 
         except Exception as e:
-            logger.error(f"Failed to execute code: {e}")
+            logger.error("Failed to execute code: %s", e)
             return {"success": False, "error": str(e), "type": type(e).__name__}
 
     def install_packages(
@@ -185,7 +185,7 @@ class PythonTools:
                 cmd.append("--upgrade")
             cmd.extend(packages)
 
-            logger.info(f"Installing packages: {packages}")
+            logger.info("Installing packages: %s", packages)
 
             # Run installation
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
@@ -215,7 +215,7 @@ class PythonTools:
                 "packages": packages,
             }
         except Exception as e:
-            logger.error(f"Failed to install packages: {e}")
+            logger.error("Failed to install packages: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -247,7 +247,7 @@ class PythonTools:
                 }
 
         except Exception as e:
-            logger.error(f"Failed to list packages: {e}")
+            logger.error("Failed to list packages: %s", e)
             return {"success": False, "error": str(e), "type": type(e).__name__}
 
     def get_python_executable(self) -> str:
@@ -4,12 +4,28 @@ RetDec integration module for binary analysis.
 Provides decompilation service integration for a single binary per MCP server session.
 """
 
-from typing import Dict, Any, Optional
+import asyncio
+import datetime
+import hashlib
+import logging
 import os
+import time
+from typing import Dict, Any, Optional
+
 import httpx
-import datetime
 
-from pwnomcp.logger import logger
+from pwnomcp.utils.serialize import dump_json, load_json
+
+logger = logging.getLogger(__name__)
+
+# Successful analyses are reused from cache_dir for this long, so a restarted
+# server does not decompile the same BINARY_URL again.
+RESULT_CACHE_TTL_SEC = 24 * 60 * 60
+
+
+def _utc_now() -> str:
+    # Timezone-aware replacement for the deprecated datetime.utcnow()
+    return datetime.datetime.now(datetime.timezone.utc).isoformat()
 
 
 class RetDecAnalyzer:
@@ -22,40 +38,109 @@ class RetDecAnalyzer:
 
     RETDEC_SERVICE_URL = "https://retdec.pwno.io"
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None):
         """
         Initialize the RetDec analyzer.
 
-        :param None:
+        :param cache_dir: Directory for cached analysis results (None disables it)
         """
         self.binary_url: Optional[str] = os.environ.get("BINARY_URL")
+        self.cache_dir = cache_dir
         self.analysis_result: Optional[Dict[str, Any]] = None
-        self._initialized = False
+        self._init_task: Optional[asyncio.Task] = None
+        # Derived once from a successful analysis; the result never changes
+        self._decompiled_code: Optional[str] = None
+        self._decompiled_payload: Optional[str] = None
+
+    def start(self) -> asyncio.Task:
+        """
+        Start the analysis if it has not been started yet.
+
+        A task that was cancelled or raised is replaced, so a later call retries.
+
+        :returns: The single analysis task shared by all callers
+        """
+        task = self._init_task
+        if task is None or (
+            task.done() and (task.cancelled() or task.exception() is not None)
+        ):
+            self._init_task = asyncio.create_task(self._initialize_once())
+        return self._init_task
 
     async def initialize(self) -> Dict[str, Any]:
         """
         Initialize and analyze the binary from BINARY_URL environment variable.
 
+        Concurrent callers wait on the same in-flight analysis; a caller that is
+        cancelled does not cancel it for the others.
+
         :returns: Analysis initialization result
         """
-        if self._initialized:
-            logger.info("RetDec analyzer already initialized")
-            return self.analysis_result or {"status": "already_initialized"}
-
-        self._initialized = True
+        return await asyncio.shield(self.start())
 
+    async def _initialize_once(self) -> Dict[str, Any]:
         if not self.binary_url:
             logger.info(
                 "No BINARY_URL environment variable found, skipping RetDec analysis"
             )
-            self.analysis_result = {
+            skipped: Dict[str, Any] = {
                 "status": "skipped",
                 "message": "No BINARY_URL environment variable provided",
             }
-            return self.analysis_result
+            self.analysis_result = skipped
+            return skipped
+
+        cached = self._load_cached_result()
+        if cached is not None:
+            logger.info("Using cached RetDec analysis for %s", self.binary_url)
+            self._set_result(cached)
+            return cached
 
         # Perform the analysis
-        return await self._analyze_binary()
+        result = await self._analyze_binary()
+        if result.get("status") == "success":
+            self._store_result()
+        return result
+
+    def _cache_path(self) -> Optional[str]:
+        if not self.cache_dir or not self.binary_url:
+            return None
+        digest = hashlib.sha256(self.binary_url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def _load_cached_result(self) -> Optional[Dict[str, Any]]:
+        path = self._cache_path()
+        if path is None:
+            return None
+        try:
+            if time.time() - os.path.getmtime(path) > RESULT_CACHE_TTL_SEC:
+                return None
+            with open(path, "rb") as f:
+                cached = load_json(f.read())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict) or cached.get("status") != "success":
+            return None
+        return cached
+
+    def _store_result(self) -> None:
+        path = self._cache_path()
+        if path is None or self.cache_dir is None:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(dump_json(self.analysis_result))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not cache RetDec result: %s", e)
+
+    def _set_result(self, result: Dict[str, Any]) -> None:
+        self.analysis_result = result
+        decompiled = result.get("decompiled") or {}
+        if result.get("status") == "success" and decompiled.get("status") == "success":
+            self._decompiled_code = decompiled.get("decompiled_code", "")
 
     async def _analyze_binary(self) -> Dict[str, Any]:
         """
@@ -63,8 +148,9 @@ class RetDecAnalyzer:
 
         :returns: Analysis result dictionary
         """
-        logger.info(f"Calling RetDec decompile service for binary: {self.binary_url}")
+        logger.info("Calling RetDec decompile service for binary: %s", self.binary_url)
 
+        result: Dict[str, Any]
         try:
             async with httpx.AsyncClient(timeout=300.0) as client:
                 response = await client.post(
@@ -73,42 +159,45 @@ class RetDecAnalyzer:
                 )
 
                 if response.status_code == 200:
-                    decompiled_data = response.json()
-                    self.analysis_result = {
+                    decompiled_data = load_json(response.content)
+                    result = {
                         "status": "success",
                         "decompiled": decompiled_data,
                         "binary_url": self.binary_url,
-                        "analyzed_at": datetime.datetime.utcnow().isoformat(),
+                        "analyzed_at": _utc_now(),
                     }
                     logger.info("RetDec decompilation completed successfully")
                 else:
-                    self.analysis_result = {
+                    result = {
                         "status": "failed",
                         "error": f"Failed to decompile: HTTP {response.status_code}",
                         "details": response.text,
                         "binary_url": self.binary_url,
-                        "analyzed_at": datetime.datetime.utcnow().isoformat(),
+                        "analyzed_at": _utc_now(),
                     }
-                    logger.error(f"RetDec decompilation failed: {response.status_code}")
+                    logger.error(
+                        "RetDec decompilation failed: %s", response.status_code
+                    )
 
         except httpx.TimeoutException:
             logger.error("RetDec service timeout")
-            self.analysis_result = {
+            result = {
                 "status": "failed",
                 "error": "Decompilation timeout (300s)",
                 "binary_url": self.binary_url,
-                "analyzed_at": datetime.datetime.utcnow().isoformat(),
+                "analyzed_at": _utc_now(),
             }
         except Exception as e:
-            logger.error(f"RetDec service error: {e}", exc_info=True)
-            self.analysis_result = {
+            logger.error("RetDec service error: %s", e, exc_info=True)
+            result = {
                 "status": "failed",
                 "error": f"Decompilation failed: {str(e)}",
                 "binary_url": self.binary_url,
-                "analyzed_at": datetime.datetime.utcnow().isoformat(),
+                "analyzed_at": _utc_now(),
             }
 
-        return self.analysis_result
+        self._set_result(result)
+        return result
 
     def get_decompiled_code(self) -> Optional[str]:
         """
@@ -116,17 +205,19 @@ class RetDecAnalyzer:
 
         :returns: Decompiled C code or None if not available
         """
-        if not self.analysis_result:
-            return None
-
-        if self.analysis_result.get("status") != "success":
-            return None
+        return self._decompiled_code
 
-        decompiled = self.analysis_result.get("decompiled", {})
-        if decompiled.get("status") == "success":
-            return decompiled.get("decompiled_code", "")
+    def get_decompiled_payload(self) -> Optional[str]:
+        """
+        Get the get_decompiled_code tool response, serialized once and reused.
 
-        return None
+        :returns: JSON string with the decompiled code, or None if not available
+        """
+        if self._decompiled_payload is None and self._decompiled_code:
+            self._decompiled_payload = dump_json(
+                {"status": "success", "decompiled_code": self._decompiled_code}
+            )
+        return self._decompiled_payload
 
     def get_status(self) -> Dict[str, Any]:
         """
@@ -135,6 +226,11 @@ class RetDecAnalyzer:
         :returns: Status dictionary with analysis information
         """
         if not self.analysis_result:
+            if self._init_task is not None and not self._init_task.done():
+                return {
+                    "status": "in_progress",
+                    "message": "RetDec decompilation is still running",
+                }
             return {
                 "status": "not_analyzed",
                 "message": "No RetDec decompilation has been performed",
@@ -8,6 +8,7 @@ Provides tools for running system commands, particularly useful for:
 """
 
 import logging
+import select
 import subprocess
 import shlex
 from typing import Dict, Any, Optional, List
@@ -22,6 +23,36 @@ from pwnomcp.utils.paths import DEFAULT_WORKSPACE
 logger = logging.getLogger(__name__)
 
 
+def wait_for_exit(process: subprocess.Popen, timeout: float) -> int:
+    """
+    Wait for a child to exit, blocking in the kernel instead of sleep-polling.
+
+    Popen.wait(timeout=...) polls with short sleeps. On Linux a pidfd becomes
+    readable the moment the child exits, so poll() on it wakes immediately.
+    Falls back to Popen.wait when pidfds are unavailable.
+
+    Raises:
+        subprocess.TimeoutExpired: if the process is still running after timeout
+    """
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is not None and process.returncode is None:
+        try:
+            fd = pidfd_open(process.pid)
+        except OSError:
+            fd = None
+        if fd is not None:
+            try:
+                poller = select.poll()
+                poller.register(fd, select.POLLIN)
+                if not poller.poll(int(timeout * 1000)):
+                    raise subprocess.TimeoutExpired(process.args, timeout)
+            finally:
+                os.close(fd)
+            # The child has exited; reap it now so returncode is set
+            return process.wait(timeout=0)
+    return process.wait(timeout=timeout)
+
+
 class SubprocessTools:
     """Tools for subprocess execution and management"""
 
@@ -172,7 +203,7 @@ class SubprocessTools:
         Returns:
             Dictionary with execution results
         """
-        logger.info(f"Running command: {command}")
+        logger.info("Running command: %s", command)
 
         try:
             # Parse command for safer execution
@@ -218,7 +249,7 @@ class SubprocessTools:
                 "cwd": cwd or os.getcwd(),
             }
         except Exception as e:
-            logger.error(f"Failed to run command: {e}")
+            logger.error("Failed to run command: %s", e)
             return {
                 "success": False,
                 "command": command,
@@ -248,7 +279,7 @@ class SubprocessTools:
         Returns:
             Dictionary with process information including PID
         """
-        logger.info(f"Spawning process: {command}")
+        logger.info("Spawning process: %s", command)
         process_dir = tempfile.mkdtemp(prefix="proc_", dir=self.process_root)
         stdout_path = os.path.join(process_dir, "stdout.log")
         stderr_path = os.path.join(process_dir, "stderr.log")
@@ -294,10 +325,11 @@ class SubprocessTools:
                 "cwd": cwd or os.getcwd(),
             }
 
-            # Give process a moment to potentially fail
-            import time
-
-            time.sleep(0.1)
+            # Give process a moment to potentially fail; returns as soon as it exits
+            try:
+                wait_for_exit(process, 0.1)
+            except subprocess.TimeoutExpired:
+                pass
 
             if process.poll() is not None:
                 # Process already terminated, read outputs
@@ -330,7 +362,7 @@ class SubprocessTools:
             }
 
         except Exception as e:
-            logger.error(f"Failed to spawn process: {e}")
+            logger.error("Failed to spawn process: %s", e)
             try:
                 stdout_file.close()
             except Exception:
@@ -397,8 +429,7 @@ class SubprocessTools:
                         "stderr_path": entry["stderr_path"],
                         "stdout": live_stdout,
                         "stderr": live_stderr,
-                        "cpu_percent": psutil.Process(pid).cpu_percent(),
-                        "memory_info": psutil.Process(pid).memory_info()._asdict(),
+                        **self._process_stats(entry, pid, memory_info=True),
                     }
                 else:
                     # Process finished, read outputs
@@ -435,7 +466,7 @@ class SubprocessTools:
                     return {"success": False, "pid": pid, "error": "Process not found"}
 
         except Exception as e:
-            logger.error(f"Failed to get process status: {e}")
+            logger.error("Failed to get process status: %s", e)
             return {"success": False, "pid": pid, "error": str(e)}
 
     def kill_process(self, pid: int, signal: int = 15) -> Dict[str, Any]:
@@ -453,7 +484,7 @@ class SubprocessTools:
             if pid in self.background_processes:
                 process = self.background_processes[pid]["process"]
                 process.terminate() if signal == 15 else process.kill()
-                process.wait(timeout=5)
+                wait_for_exit(process, 5)
                 # Keep the process entry cached even after kill, so get_process can retrieve outputs
                 # del self.background_processes[pid]
             else:
@@ -464,9 +495,32 @@ class SubprocessTools:
         except ProcessLookupError:
             return {"success": False, "pid": pid, "error": "Process not found"}
         except Exception as e:
-            logger.error(f"Failed to kill process: {e}")
+            logger.error("Failed to kill process: %s", e)
             return {"success": False, "pid": pid, "error": str(e)}
 
+    @staticmethod
+    def _process_stats(
+        entry: Dict[str, Any], pid: int, memory_info: bool = False
+    ) -> Dict[str, Any]:
+        # The psutil handle is kept on the entry so cpu_percent() measures
+        # since the previous call (a fresh handle always reports 0.0), and
+        # oneshot() serves all fields from a single read of /proc/<pid>.
+        proc_info = entry.get("psutil")
+        if proc_info is None:
+            proc_info = entry["psutil"] = psutil.Process(pid)
+        with proc_info.oneshot():
+            if memory_info:
+                return {
+                    "cpu_percent": proc_info.cpu_percent(),
+                    "memory_info": proc_info.memory_info()._asdict(),
+                }
+            return {
+                "name": proc_info.name(),
+                "cmdline": " ".join(proc_info.cmdline()),
+                "cpu_percent": proc_info.cpu_percent(),
+                "memory_mb": proc_info.memory_info().rss / 1024 / 1024,
+            }
+
     def list_processes(self) -> Dict[str, Any]:
         """
         List all tracked background processes
@@ -482,16 +536,12 @@ class SubprocessTools:
             if poll_result is None:
                 # Still running
                 try:
-                    proc_info = psutil.Process(pid)
                     processes.append(
                         {
                             "pid": pid,
                             "status": "running",
                             "process_dir": entry.get("process_dir"),
-                            "name": proc_info.name(),
-                            "cmdline": " ".join(proc_info.cmdline()),
-                            "cpu_percent": proc_info.cpu_percent(),
-                            "memory_mb": proc_info.memory_info().rss / 1024 / 1024,
+                            **self._process_stats(entry, pid),
                         }
                     )
                 except:
@@ -566,7 +616,7 @@ class SubprocessTools:
                         }
                     time.sleep(poll_interval)
         except Exception as e:
-            logger.error(f"Failed while waiting for PID marker: {e}")
+            logger.error("Failed while waiting for PID marker: %s", e)
             return {
                 "success": False,
                 "error": str(e),
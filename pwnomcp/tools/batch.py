@@ -0,0 +1,201 @@
+import asyncio
+import contextlib
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastmcp import Context, FastMCP
+from fastmcp.dependencies import CurrentContext
+
+from pwnomcp.state import DebugSession
+from pwnomcp.tools.common import (
+    catch_errors,
+    get_services,
+    resolve_debug_session,
+    run_session_action,
+)
+
+logger = logging.getLogger(__name__)
+
+# PwndbgTools methods that can be batched; arguments use the same names as the
+# corresponding MCP tools.
+BATCH_TOOLS = frozenset(
+    {
+        "execute",
+        "set_breakpoint",
+        "run",
+        "step_control",
+        "finish",
+        "jump",
+        "until",
+        "return_from_function",
+        "gdb_poll",
+        "gdb_interrupt",
+        "get_context",
+        "get_memory",
+        "get_session_info",
+    }
+)
+
+
+def _failed(result: Dict[str, Any]) -> bool:
+    return result.get("success", True) is False
+
+
+def run_batch(
+    session: DebugSession,
+    calls: List[Dict[str, Any]],
+    stop_on_error: bool = False,
+    abort: Optional[threading.Event] = None,
+    results: Optional[List[Dict[str, Any]]] = None,
+    guard: Optional[threading.Lock] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run debugger calls in order against one session (caller holds the lock).
+
+    Calls after a failure (with stop_on_error) or after abort is set are reported
+    as skipped. Each entry is appended to ``results`` when its call starts and
+    gets its ``result`` once it finishes, so a caller that gives up waiting can
+    tell finished, in-flight and unstarted calls apart. ``guard`` makes the abort
+    check and the append atomic with a caller that sets abort under it.
+    """
+    if results is None:
+        results = []
+    stopped = False
+    for call in calls:
+        name = call.get("tool")
+        entry: Dict[str, Any] = {"tool": name}
+        with guard or contextlib.nullcontext():
+            if stopped or (abort is not None and abort.is_set()):
+                entry["skipped"] = True
+            results.append(entry)
+        if entry.get("skipped"):
+            continue
+        args = call.get("args") or {}
+        if name not in BATCH_TOOLS:
+            result: Dict[str, Any] = {
+                "success": False,
+                "error": f"Unsupported batch tool: {name}",
+            }
+        else:
+            try:
+                result = getattr(session.tools, name)(**args)
+            except Exception as e:
+                logger.exception("batch call %s failed", name)
+                result = {"success": False, "error": str(e), "type": type(e).__name__}
+        entry["result"] = result
+        if stop_on_error and _failed(result):
+            stopped = True
+            if abort is not None:
+                abort.set()
+    return results
+
+
+def register(mcp: FastMCP) -> None:
+    @mcp.tool()
+    @catch_errors()
+    async def batch_execute(
+        calls: List[Dict[str, Any]],
+        session_id: str,
+        max_concurrent: int = 8,
+        stop_on_error: bool = False,
+        timeout: float = 30.0,
+        ctx: Context = CurrentContext(),
+    ) -> Dict[str, Any]:
+        """Run several debugger tool calls within a single request.
+
+        Each call is {"tool": name, "args": {...}, "session_id": optional}, with the same
+        args as the standalone tool (execute, set_breakpoint, run, step_control, finish,
+        jump, until, return_from_function, gdb_poll, gdb_interrupt, get_context,
+        get_memory, get_session_info). Calls for one session run in order; different
+        sessions run concurrently.
+
+        Args:
+            max_concurrent: Maximum number of sessions worked on at once.
+            stop_on_error: Skip remaining calls after the first failure.
+            timeout: Seconds for the whole batch. Calls not started by then are
+                skipped; a call still running is reported with "outcome": "unknown"
+                because it keeps running in GDB and may still take effect.
+        """
+        services = get_services(ctx)
+        groups: Dict[str, List[Tuple[int, Dict[str, Any]]]] = {}
+        for index, call in enumerate(calls):
+            groups.setdefault(call.get("session_id") or session_id, []).append(
+                (index, call)
+            )
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(calls)
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        abort = threading.Event()
+        guard = threading.Lock()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        timed_out = False
+
+        async def run_group(
+            group_session_id: str, entries: List[Tuple[int, Dict[str, Any]]]
+        ) -> None:
+            nonlocal timed_out
+            group_calls = [call for _, call in entries]
+            done: List[Dict[str, Any]] = []
+            error: Optional[Dict[str, Any]] = None
+            async with semaphore:
+                try:
+                    session = resolve_debug_session(
+                        services, session_id=group_session_id, create_if_missing=False
+                    )
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        raise asyncio.TimeoutError
+                    await asyncio.wait_for(
+                        run_session_action(
+                            session,
+                            lambda: run_batch(
+                                session, group_calls, stop_on_error, abort, done, guard
+                            ),
+                        ),
+                        timeout=remaining,
+                    )
+                except asyncio.TimeoutError:
+                    timed_out = True
+                except Exception as e:
+                    error = {
+                        "success": False,
+                        "error": str(e),
+                        "type": type(e).__name__,
+                    }
+            with guard:
+                if timed_out:
+                    # The worker skips whatever it has not started yet.
+                    abort.set()
+                finished = list(done)
+            for (index, _), entry in zip(entries, finished):
+                entry = dict(entry)
+                entry["session_id"] = group_session_id
+                if "result" not in entry and not entry.get("skipped"):
+                    entry["outcome"] = "unknown"
+                    entry["error"] = (
+                        f"Batch timed out after {timeout}s while this call was "
+                        "running; it may still complete"
+                    )
+                results[index] = entry
+            for index, call in entries[len(finished) :]:
+                entry = {"tool": call.get("tool"), "session_id": group_session_id}
+                if error is None:
+                    entry["skipped"] = True
+                else:
+                    entry["result"] = error
+                results[index] = entry
+
+        await asyncio.gather(
+            *(run_group(sid, entries) for sid, entries in groups.items())
+        )
+        return {
+            "success": not timed_out
+            and all(
+                entry is not None and "result" in entry and not _failed(entry["result"])
+                for entry in results
+            ),
+            "session_id": session_id,
+            "results": results,
+        }
@@ -1,7 +1,9 @@
 import asyncio
+import contextvars
 import logging
 import os
-from functools import wraps
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
 from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
 
 from fastmcp import Context
@@ -15,6 +17,33 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+def _env_workers(name: str, default: int) -> int:
+    value = os.environ.get(name, "")
+    if not value:
+        return default
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        logger.warning("Ignoring invalid %s=%r; using %d", name, value, default)
+        return default
+    return workers
+
+
+# Bounded pools for blocking tool work. Commands that can run for minutes
+# (shell, python, pip, git clone) get their own pool so they cannot starve
+# quick GDB/process calls.
+_TOOL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_env_workers("PWNO_MCP_TOOL_WORKERS", 16),
+    thread_name_prefix="pwno-mcp-tool",
+)
+_LONG_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_env_workers("PWNO_MCP_LONG_WORKERS", 8),
+    thread_name_prefix="pwno-mcp-long",
+)
+
+
 def catch_errors(tuple_on_error: bool = False) -> Callable[[Callable[..., Any]], Any]:
     def decorator(fn: Callable[..., Any]) -> Any:
         @wraps(fn)
@@ -43,8 +72,12 @@ def get_services(ctx: Context) -> AppServices:
     return services
 
 
-async def run_blocking(fn: Callable[[], T]) -> T:
-    return await asyncio.to_thread(fn)
+async def run_blocking(fn: Callable[[], T], long_running: bool = False) -> T:
+    loop = asyncio.get_running_loop()
+    # Carry contextvars into the worker, as asyncio.to_thread does.
+    call = partial(contextvars.copy_context().run, fn)
+    executor = _LONG_EXECUTOR if long_running else _TOOL_EXECUTOR
+    return await loop.run_in_executor(executor, call)
 
 
 def require_session_registry(services: AppServices) -> DebugSessionRegistry:
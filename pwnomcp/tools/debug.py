@@ -9,6 +9,7 @@ from pwnomcp.tools.common import (
     resolve_binary_path,
     resolve_debug_session,
     require_session_registry,
+    run_blocking,
     run_session_action,
 )
 
@@ -22,8 +23,10 @@ def register(mcp: FastMCP) -> None:
     ) -> Dict[str, Any]:
         """Create or return a debug session by id."""
         services = get_services(ctx)
-        session = resolve_debug_session(
-            services, session_id=session_id, create_if_missing=True
+        session = await run_blocking(
+            lambda: resolve_debug_session(
+                services, session_id=session_id, create_if_missing=True
+            )
         )
         return {"success": True, "session": session.to_dict()}
 
@@ -54,7 +57,7 @@ def register(mcp: FastMCP) -> None:
         if pipe:
             pipe.kill()
 
-        return registry.close_session(session_id)
+        return await run_blocking(lambda: registry.close_session(session_id))
 
     @mcp.tool()
     @catch_errors()
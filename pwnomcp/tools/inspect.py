@@ -49,8 +49,8 @@ def register(mcp: FastMCP) -> None:
         Args:
             address: Start address expression (e.g., "$rsp", "0xdeadbeef").
             size: Number of bytes to read.
-            format: "hex" for raw bytes (fast path), "string" for x/s, otherwise MI grid
-                format.
+            format: "hex" for raw bytes (fast path), "base64" for the same bytes
+                base64-encoded, "string" for x/s, otherwise MI grid format.
         """
         services = get_services(ctx)
         session = resolve_debug_session(
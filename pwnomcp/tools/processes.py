@@ -1,11 +1,12 @@
-import json
 from typing import Optional
 
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import CurrentContext
 
 from pwnomcp.tools.common import get_services, run_blocking
+from pwnomcp.utils.format import tabularize
 from pwnomcp.utils.paths import DEFAULT_WORKSPACE, resolve_workspace_cwd
+from pwnomcp.utils.serialize import dump_json
 
 
 def register(mcp: FastMCP) -> None:
@@ -27,8 +28,8 @@ def register(mcp: FastMCP) -> None:
 
         Args:
             command: Shell command to run.
-            cwd: Working directory (defaults to /workspace). Use a container-visible path
-                under /workspace; relative paths resolve under /workspace.
+            cwd: Working directory (default /workspace); relative paths resolve
+                under /workspace.
             timeout: Timeout in seconds.
 
         Returns:
@@ -37,10 +38,10 @@ def register(mcp: FastMCP) -> None:
         services = get_services(ctx)
         tools = services.subprocess_tools
         cwd = resolve_workspace_cwd(cwd, workspace_root=DEFAULT_WORKSPACE)
-        result = await run_blocking(
-            lambda: tools.run_command(command, cwd=cwd, timeout=timeout)
+        return await run_blocking(
+            lambda: dump_json(tools.run_command(command, cwd=cwd, timeout=timeout)),
+            long_running=True,
         )
-        return json.dumps(result, indent=2)
 
     @mcp.tool()
     async def spawn_process(
@@ -58,21 +59,23 @@ def register(mcp: FastMCP) -> None:
 
         Args:
             command: Shell command to spawn.
-            cwd: Working directory (defaults to /workspace). Use a container-visible path
-                under /workspace; relative paths resolve under /workspace.
+            cwd: Working directory (default /workspace); relative paths resolve
+                under /workspace.
         """
         services = get_services(ctx)
         tools = services.subprocess_tools
         cwd = resolve_workspace_cwd(cwd, workspace_root=DEFAULT_WORKSPACE)
-        result = await run_blocking(lambda: tools.spawn_process(command, cwd=cwd))
-        return json.dumps(result, indent=2)
+        return await run_blocking(
+            lambda: dump_json(tools.spawn_process(command, cwd=cwd))
+        )
 
     @mcp.tool()
     async def get_process(pid: int, ctx: Context = CurrentContext()) -> str:
         """Get information about a tracked background process by PID."""
         services = get_services(ctx)
-        result = await run_blocking(lambda: services.subprocess_tools.get_process(pid))
-        return json.dumps(result, indent=2)
+        return await run_blocking(
+            lambda: dump_json(services.subprocess_tools.get_process(pid))
+        )
 
     @mcp.tool()
     async def kill_process(
@@ -82,14 +85,23 @@ def register(mcp: FastMCP) -> None:
     ) -> str:
         """Send a signal to a tracked background process (default SIGTERM=15)."""
         services = get_services(ctx)
-        result = await run_blocking(
-            lambda: services.subprocess_tools.kill_process(pid, signal)
+        return await run_blocking(
+            lambda: dump_json(services.subprocess_tools.kill_process(pid, signal))
         )
-        return json.dumps(result, indent=2)
 
     @mcp.tool()
     async def list_processes(ctx: Context = CurrentContext()) -> str:
-        """List all tracked background processes and their metadata (PID, command, log paths)."""
+        """List all tracked background processes and their metadata (PID, command, log paths).
+
+        When every entry has the same fields, "processes" is a table:
+        {"columns": [...], "rows": [[...], ...]}; otherwise it is a list of objects.
+        """
         services = get_services(ctx)
-        result = await run_blocking(services.subprocess_tools.list_processes)
-        return json.dumps(result, indent=2)
+
+        def _list() -> str:
+            result = services.subprocess_tools.list_processes()
+            if "processes" in result:
+                result["processes"] = tabularize(result["processes"])
+            return dump_json(result)
+
+        return await run_blocking(_list)
@@ -32,36 +32,22 @@ def register(mcp: FastMCP) -> None:
     ) -> Dict[str, Any]:
         """Run a pwncli exploit script for a specific debug session.
 
-        Behavior:
-        - Writes the provided script content to a per-session runtime directory
-        - Launches: uv run <session-script> debug <resolved binary> <argument>
-        - Maintains one PwnPipe per debug session
-        - Detects a single-line marker printed by pwncli after attach:
-          "PWNCLI_ATTACH_RESULT:{...json...}" and exposes it as attachment.result
-        - Waits up to wait_timeout seconds for attach/output/exit before returning
-        - Stores inline script content in session runtime state; only create persistent
-          /workspace scripts when the user explicitly requests it
+        Runs `uv run <script> debug <binary> <argument>` with one PwnPipe per session and
+        waits up to wait_timeout seconds for attach/output/exit. The pwncli marker line
+        "PWNCLI_ATTACH_RESULT:{...}" is exposed as attachment.result. The script is kept
+        in the session runtime dir; only create persistent /workspace scripts when the
+        user explicitly requests it.
 
         Args:
             file: Full contents of a pwncli-style Python script.
             argument: Additional pwncli arguments after "debug <binary>".
-            wait_timeout: Max time (seconds) to wait for initial attach/output/exit signal.
-            binary_path: Optional target binary path (resolved under /workspace). Use a
-                container-visible path under /workspace; relative paths resolve under
-                /workspace.
+            wait_timeout: Max seconds to wait for the first attach/output/exit signal.
+            binary_path: Optional target binary; relative paths resolve under /workspace.
             session_id: Debug session id.
 
         Returns:
-            {
-              "io": {
-                "pipeinput": bool,    # whether stdin is available
-                "pipeoutput": bool,   # whether output collection succeeded for this call
-                "current_output": str # any currently buffered output consumed by this call
-              },
-              "attachment": {
-                "result": dict | None # parsed attach result from the marker if present
-              }
-            }
+            {"io": {"current_output": str, ...}, "attachment": {"result": dict|None},
+             "startup": {"ready", "reason", "alive", "pid", ...}}
         """
         services = get_services(ctx)
         session = resolve_debug_session(
@@ -70,34 +56,36 @@ def register(mcp: FastMCP) -> None:
         resolved_binary = resolve_binary_path(binary_path, session, require_exists=True)
 
         runtime_dir = session.runtime_dir
-        os.makedirs(runtime_dir, exist_ok=True)
-        script_path = os.path.join(runtime_dir, f"exp_{int(time.time() * 1000)}.py")
-        with open(script_path, "w", encoding="utf-8") as f:
-            f.write(file)
 
-        replaced = False
-        driver_pid: Optional[int] = None
-        old_pipe: Optional[PwnPipe] = None
-        with services.pwnpipe_lock:
-            old_pipe = services.pwnpipe_sessions.get(session.session_id)
-            if old_pipe and old_pipe.is_alive():
-                replaced = True
-            services.pwnpipe_sessions.pop(session.session_id, None)
+        def _launch() -> Tuple[PwnPipe, Optional[int], bool]:
+            os.makedirs(runtime_dir, exist_ok=True)
+            script_path = os.path.join(runtime_dir, f"exp_{int(time.time() * 1000)}.py")
+            with open(script_path, "w", encoding="utf-8") as f:
+                f.write(file)
 
             cmd = (
                 f"uv run {shlex.quote(script_path)} debug {shlex.quote(resolved_binary)} {argument}"
             ).strip()
-            pipe = PwnPipe(
+            new_pipe = PwnPipe(
                 command=cmd,
                 cwd=os.path.dirname(resolved_binary),
                 env={"PYTHONUNBUFFERED": "1"},
             )
-            services.pwnpipe_sessions[session.session_id] = pipe
-            driver_pid = pipe.get_pid()
-            session.driver_pid = driver_pid
+            new_pid = new_pipe.get_pid()
 
-        if old_pipe and old_pipe.is_alive():
-            old_pipe.kill()
+            # Only the swap happens under pwnpipe_lock; other tools take it on
+            # the event loop, so it must not be held across the spawn.
+            with services.pwnpipe_lock:
+                old_pipe = services.pwnpipe_sessions.get(session.session_id)
+                services.pwnpipe_sessions[session.session_id] = new_pipe
+                session.driver_pid = new_pid
+            replaced = bool(old_pipe and old_pipe.is_alive())
+
+            if old_pipe and old_pipe.is_alive():
+                old_pipe.kill()
+            return new_pipe, new_pid, replaced
+
+        pipe, driver_pid, replaced = await run_blocking(_launch)
 
         def _collect_startup() -> Tuple[Dict[str, Any], str, Any]:
             startup_result = pipe.wait_ready(timeout=wait_timeout)
@@ -150,14 +138,21 @@ def register(mcp: FastMCP) -> None:
         """
         services = get_services(ctx)
         resolved_session_id, pipe = get_pwnpipe(services, session_id=session_id)
-        with services.pwnpipe_lock:
+
+        def _send() -> Optional[bool]:
+            # Not under pwnpipe_lock: send() can wait up to SEND_TIMEOUT_SEC
+            # for the driver to drain its stdin.
             if not pipe.is_alive():
-                return {
-                    "success": False,
-                    "session_id": resolved_session_id,
-                    "error": "No active PwnPipe",
-                }
-            ok = pipe.send(data)
+                return None
+            return pipe.send(data)
+
+        ok = await run_blocking(_send)
+        if ok is None:
+            return {
+                "success": False,
+                "session_id": resolved_session_id,
+                "error": "No active PwnPipe",
+            }
         return {"success": bool(ok), "session_id": resolved_session_id}
 
     @mcp.tool()
@@ -1,4 +1,3 @@
-import json
 from typing import Optional
 
 from fastmcp import Context, FastMCP
@@ -10,6 +9,7 @@ from pwnomcp.utils.paths import (
     resolve_workspace_cwd,
     resolve_workspace_path,
 )
+from pwnomcp.utils.serialize import dump_json
 
 
 def register(mcp: FastMCP) -> None:
@@ -24,11 +24,10 @@ def register(mcp: FastMCP) -> None:
         """Execute an existing Python script within the shared environment.
 
         Args:
-            script_path: Path to the script. Use a container-visible path under
-                /workspace; relative paths resolve under /workspace.
+            script_path: Path to the script; relative paths resolve under /workspace.
             args: Space-separated args for the script.
-            cwd: Working directory (default /workspace). Use a container-visible path
-                under /workspace; relative paths resolve under /workspace.
+            cwd: Working directory (default /workspace); relative paths resolve
+                under /workspace.
             timeout: Seconds to wait before termination.
         """
         services = get_services(ctx)
@@ -41,10 +40,12 @@ def register(mcp: FastMCP) -> None:
         )
         cwd = resolve_workspace_cwd(cwd, workspace_root=DEFAULT_WORKSPACE)
         args_list = args.split() if args else None
-        result = await run_blocking(
-            lambda: tools.execute_script(resolved_script_path, args_list, cwd, timeout)
+        return await run_blocking(
+            lambda: dump_json(
+                tools.execute_script(resolved_script_path, args_list, cwd, timeout)
+            ),
+            long_running=True,
         )
-        return json.dumps(result, indent=2)
 
     @mcp.tool()
     async def execute_python_code(
@@ -57,9 +58,8 @@ def register(mcp: FastMCP) -> None:
 
         Args:
             code: Python source code to run.
-            cwd: Working directory (default /workspace). If provided, use a
-                container-visible path under /workspace; relative paths resolve under
-                /workspace.
+            cwd: Working directory (default /workspace); relative paths resolve
+                under /workspace.
             timeout: Seconds to wait before termination.
 
         Prefer this for quick probes and analysis, and only persist files in /workspace when the user explicitly asks.
@@ -67,8 +67,10 @@ def register(mcp: FastMCP) -> None:
         services = get_services(ctx)
         tools = services.python_tools
         cwd = resolve_workspace_cwd(cwd, workspace_root=DEFAULT_WORKSPACE)
-        result = await run_blocking(lambda: tools.execute_code(code, cwd, timeout))
-        return json.dumps(result, indent=2)
+        return await run_blocking(
+            lambda: dump_json(tools.execute_code(code, cwd, timeout)),
+            long_running=True,
+        )
 
     @mcp.tool()
     async def install_python_packages(
@@ -85,14 +87,15 @@ def register(mcp: FastMCP) -> None:
         services = get_services(ctx)
         tools = services.python_tools
         packages_list = packages.split()
-        result = await run_blocking(
-            lambda: tools.install_packages(packages_list, upgrade)
+        return await run_blocking(
+            lambda: dump_json(tools.install_packages(packages_list, upgrade)),
+            long_running=True,
         )
-        return json.dumps(result, indent=2)
 
     @mcp.tool()
     async def list_python_packages(ctx: Context = CurrentContext()) -> str:
         """List all packages installed in the shared Python environment."""
         services = get_services(ctx)
-        result = await run_blocking(services.python_tools.get_installed_packages)
-        return json.dumps(result, indent=2)
+        return await run_blocking(
+            lambda: dump_json(services.python_tools.get_installed_packages())
+        )
@@ -1,4 +1,3 @@
-import json
 import os
 from typing import Optional
 
@@ -7,6 +6,7 @@ from fastmcp.dependencies import CurrentContext
 
 from pwnomcp.tools.common import get_services, run_blocking
 from pwnomcp.utils.paths import DEFAULT_WORKSPACE, resolve_workspace_path
+from pwnomcp.utils.serialize import dump_json
 
 
 def register(mcp: FastMCP) -> None:
@@ -40,7 +40,7 @@ def register(mcp: FastMCP) -> None:
         else:
             repo_name = repo_url.rstrip("/").split("/")[-1].replace(".git", "")
             target_dir = os.path.join(DEFAULT_WORKSPACE, repo_name)
-        result = await run_blocking(
-            lambda: tools.fetch_repo(repo_url, version, target_dir, shallow)
+        return await run_blocking(
+            lambda: dump_json(tools.fetch_repo(repo_url, version, target_dir, shallow)),
+            long_running=True,
         )
-        return json.dumps(result, indent=2)
@@ -1,39 +1,42 @@
-import json
+import asyncio
 
 from fastmcp import Context, FastMCP
 from fastmcp.dependencies import CurrentContext
 
-from pwnomcp.tools.common import get_services
+from pwnomcp.tools.common import get_services, run_blocking
+from pwnomcp.utils.serialize import dump_json
 
 
 def register(mcp: FastMCP) -> None:
     @mcp.tool()
     async def get_retdec_status(ctx: Context = CurrentContext()) -> str:
-        """Get the current RetDec decompilation status, lazily initializing as needed."""
+        """Get the current RetDec decompilation status, starting the analysis if needed."""
         services = get_services(ctx)
         analyzer = services.retdec_analyzer
-        if not analyzer._initialized:
-            await analyzer.initialize()
+        # Report in_progress instead of waiting out a running analysis. One
+        # yield lets a skipped or cached analysis finish first.
+        analyzer.start()
+        await asyncio.sleep(0)
         status = analyzer.get_status()
-        return json.dumps(status, indent=2)
+        return dump_json(status)
 
     @mcp.tool()
     async def get_decompiled_code(ctx: Context = CurrentContext()) -> str:
         """Return RetDec decompiled C code if available, or a status describing why not."""
         services = get_services(ctx)
         analyzer = services.retdec_analyzer
-        if not analyzer._initialized:
-            await analyzer.initialize()
-        code = analyzer.get_decompiled_code()
-        if code:
-            return json.dumps({"status": "success", "decompiled_code": code}, indent=2)
+        await analyzer.initialize()
+        if analyzer.get_decompiled_code():
+            # Decompiled sources can be large; encode them off the event loop
+            payload = await run_blocking(analyzer.get_decompiled_payload)
+            if payload is not None:
+                return payload
 
         status = analyzer.get_status()
-        return json.dumps(
+        return dump_json(
             {
                 "status": "unavailable",
                 "reason": status.get("status"),
                 "details": status,
-            },
-            indent=2,
+            }
         )
@@ -4,11 +4,14 @@ from typing import Any, Callable, Dict, TypeVar, Union
 
 T = TypeVar("T")
 
+_ANSI_ESCAPE = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
+
 
 def strip_ansi_codes(text: str) -> str:
     """Strip ANSI escape codes from text"""
-    ansi_escape = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
-    return ansi_escape.sub("", text)
+    if "\x1b" not in text:
+        return text
+    return _ANSI_ESCAPE.sub("", text)
 
 
 def strip_color(
@@ -0,0 +1,22 @@
+from typing import Any, Dict, List, Union
+
+
+def tabularize(
+    rows: List[Dict[str, Any]],
+) -> Union[Dict[str, List[Any]], List[Dict[str, Any]]]:
+    """
+    Collapse a list of same-shaped dicts into a columns/rows table.
+
+    Keys are emitted once instead of once per row. Lists whose dicts do not all
+    share the same keys (or that are empty) are returned unchanged.
+
+    :param rows: List of dicts, e.g. process entries
+    :return: {"columns": [...], "rows": [[...], ...]} or the original list
+    """
+    if not rows:
+        return rows
+    columns = list(rows[0])
+    keys = set(columns)
+    if any(row.keys() != keys for row in rows):
+        return rows
+    return {"columns": columns, "rows": [[row[k] for k in columns] for row in rows]}
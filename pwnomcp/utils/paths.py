@@ -147,5 +147,7 @@ def resolve_workspace_cwd(
     resolved = resolve_workspace_path(
         cwd, workspace_root=workspace_root, require_exists=False, kind="cwd"
     )
-    os.makedirs(resolved, exist_ok=True)
+    # One stat in the common case; makedirs would attempt mkdir and then stat
+    if not os.path.isdir(resolved):
+        os.makedirs(resolved, exist_ok=True)
     return resolved
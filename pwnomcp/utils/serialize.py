@@ -0,0 +1,47 @@
+import json
+import os
+from typing import Any, Union
+
+try:
+    import orjson as _orjson
+except ImportError:  # optional; used when installed
+    _orjson = None
+
+# Tool results are parsed by programs, not read by humans; indent only on request.
+PRETTY_JSON = os.environ.get("PWNO_MCP_PRETTY", "0") not in ("", "0")
+
+
+def dump_json(obj: Any) -> str:
+    """
+    Serialize a tool result to the JSON string returned to MCP clients.
+
+    Output is compact unless PWNO_MCP_PRETTY is set (then indented by 2).
+    Uses orjson when installed and falls back to the stdlib encoder for
+    anything orjson rejects (e.g. integers wider than 64 bits).
+
+    :param obj: JSON-compatible result (dict/list/scalars)
+    :return: JSON text
+    """
+    if _orjson is not None:
+        option = _orjson.OPT_NON_STR_KEYS
+        if PRETTY_JSON:
+            option |= _orjson.OPT_INDENT_2
+        try:
+            return _orjson.dumps(obj, option=option).decode()
+        except TypeError:
+            pass
+    if PRETTY_JSON:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def load_json(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text or bytes, with orjson when installed.
+
+    :param data: JSON document
+    :return: Parsed value
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
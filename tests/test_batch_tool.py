@@ -0,0 +1,196 @@
+import threading
+
+import pytest
+
+from pwnomcp.tools import batch as batch_module
+from pwnomcp.tools.batch import run_batch
+
+
+class FakePwndbgTools:
+    def __init__(self):
+        self.calls = []
+
+    def set_breakpoint(self, location, condition=None):
+        self.calls.append(("set_breakpoint", location, condition))
+        return {"success": True, "command": "-break-insert"}
+
+    def step_control(self, command):
+        self.calls.append(("step_control", command))
+        raise RuntimeError("not running")
+
+    def set_file(self, path):
+        self.calls.append(("set_file", path))
+        return {"success": True}
+
+    def execute(self, command, gate=None):
+        self.calls.append(("execute", command))
+        if gate is not None:
+            gate.wait(timeout=5)
+        return {"success": True, "command": command}
+
+
+class FakeSession:
+    def __init__(self, tools):
+        self.session_id = "s1"
+        self.tools = tools
+        self.lock = threading.RLock()
+        self.gdb = type("Gdb", (), {"get_inferior_pid": lambda self: None})()
+        self.state = type("State", (), {"pid": None})()
+
+
+class CaptureMCP:
+    def __init__(self):
+        self.tools = {}
+
+    def tool(self):
+        def decorator(fn):
+            self.tools[fn.__name__] = fn
+            return fn
+
+        return decorator
+
+
+def _batch_execute(monkeypatch, sessions):
+    monkeypatch.setattr(
+        batch_module,
+        "resolve_debug_session",
+        lambda services, session_id, create_if_missing: sessions[session_id],
+    )
+    mcp = CaptureMCP()
+    batch_module.register(mcp)
+    return mcp.tools["batch_execute"]
+
+
+class FakeContext:
+    lifespan_context = {"services": object()}
+
+
+def test_run_batch_runs_calls_in_order_and_reports_each():
+    tools = FakePwndbgTools()
+    results = run_batch(
+        FakeSession(tools),
+        [
+            {"tool": "set_breakpoint", "args": {"location": "main"}},
+            {"tool": "step_control", "args": {"command": "n"}},
+            {"tool": "set_file", "args": {"path": "/workspace/chal"}},
+        ],
+    )
+
+    assert tools.calls == [("set_breakpoint", "main", None), ("step_control", "n")]
+    assert results[0] == {
+        "tool": "set_breakpoint",
+        "result": {"success": True, "command": "-break-insert"},
+    }
+    assert results[1]["result"]["success"] is False
+    assert results[1]["result"]["type"] == "RuntimeError"
+    assert results[2]["result"]["success"] is False
+    assert "Unsupported" in results[2]["result"]["error"]
+
+
+def test_run_batch_stop_on_error_skips_remaining_calls():
+    tools = FakePwndbgTools()
+    abort = threading.Event()
+    results = run_batch(
+        FakeSession(tools),
+        [
+            {"tool": "step_control", "args": {"command": "n"}},
+            {"tool": "set_breakpoint", "args": {"location": "main"}},
+        ],
+        stop_on_error=True,
+        abort=abort,
+    )
+
+    assert tools.calls == [("step_control", "n")]
+    assert results[1] == {"tool": "set_breakpoint", "skipped": True}
+    assert abort.is_set()
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_times_out_slow_session_only(monkeypatch):
+    slow, fast = FakePwndbgTools(), FakePwndbgTools()
+    gate = threading.Event()
+    batch_execute = _batch_execute(
+        monkeypatch, {"slow": FakeSession(slow), "fast": FakeSession(fast)}
+    )
+
+    try:
+        response = await batch_execute(
+            calls=[
+                {"tool": "execute", "args": {"command": "c", "gate": gate}},
+                {"tool": "set_breakpoint", "args": {"location": "main"}},
+                {
+                    "tool": "set_breakpoint",
+                    "args": {"location": "win"},
+                    "session_id": "fast",
+                },
+            ],
+            session_id="slow",
+            timeout=0.2,
+            ctx=FakeContext(),
+        )
+    finally:
+        gate.set()
+
+    results = response["results"]
+    assert response["success"] is False
+    assert results[0]["session_id"] == "slow"
+    assert results[0]["outcome"] == "unknown"
+    assert "may still complete" in results[0]["error"]
+    assert results[1] == {
+        "tool": "set_breakpoint",
+        "session_id": "slow",
+        "skipped": True,
+    }
+    assert results[2] == {
+        "tool": "set_breakpoint",
+        "result": {"success": True, "command": "-break-insert"},
+        "session_id": "fast",
+    }
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_stop_on_error_aborts_other_sessions(monkeypatch):
+    first, second = FakePwndbgTools(), FakePwndbgTools()
+    batch_execute = _batch_execute(
+        monkeypatch, {"a": FakeSession(first), "b": FakeSession(second)}
+    )
+
+    # One session at a time, so "a" fails before "b" starts
+    response = await batch_execute(
+        calls=[
+            {"tool": "step_control", "args": {"command": "n"}},
+            {"tool": "set_breakpoint", "args": {"location": "main"}, "session_id": "b"},
+        ],
+        session_id="a",
+        max_concurrent=1,
+        stop_on_error=True,
+        ctx=FakeContext(),
+    )
+
+    assert response["success"] is False
+    assert response["results"][0]["result"]["type"] == "RuntimeError"
+    assert response["results"][1] == {
+        "tool": "set_breakpoint",
+        "skipped": True,
+        "session_id": "b",
+    }
+    assert second.calls == []
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_expired_deadline_starts_nothing(monkeypatch):
+    tools = FakePwndbgTools()
+    batch_execute = _batch_execute(monkeypatch, {"a": FakeSession(tools)})
+
+    response = await batch_execute(
+        calls=[{"tool": "set_breakpoint", "args": {"location": "main"}}],
+        session_id="a",
+        timeout=0,
+        ctx=FakeContext(),
+    )
+
+    assert response["success"] is False
+    assert response["results"] == [
+        {"tool": "set_breakpoint", "session_id": "a", "skipped": True}
+    ]
+    assert tools.calls == []
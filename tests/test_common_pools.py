@@ -0,0 +1,10 @@
+from pwnomcp.tools.common import _env_workers
+
+
+def test_env_workers_falls_back_on_invalid_values(monkeypatch):
+    monkeypatch.setenv("PWNO_MCP_TOOL_WORKERS", "4")
+    assert _env_workers("PWNO_MCP_TOOL_WORKERS", 16) == 4
+
+    for value in ("", "0", "-2", "lots"):
+        monkeypatch.setenv("PWNO_MCP_TOOL_WORKERS", value)
+        assert _env_workers("PWNO_MCP_TOOL_WORKERS", 16) == 16
@@ -0,0 +1,17 @@
+from pwnomcp.utils.format import tabularize
+
+
+def test_tabularize_uniform_rows():
+    rows = [{"pid": 1, "status": "running"}, {"status": "running", "pid": 2}]
+
+    assert tabularize(rows) == {
+        "columns": ["pid", "status"],
+        "rows": [[1, "running"], [2, "running"]],
+    }
+
+
+def test_tabularize_keeps_mixed_rows():
+    rows = [{"pid": 1, "status": "running"}, {"pid": 2, "error": "gone"}]
+
+    assert tabularize(rows) is rows
+    assert tabularize([]) == []
@@ -0,0 +1,26 @@
+from pwnomcp.state import SessionState
+from pwnomcp.tools.backends.pwndbg import PwndbgTools
+
+
+class FakeGdb:
+    def __init__(self):
+        self.calls = []
+
+    def initialize(self):
+        return {"status": "already_initialized", "messages": []}
+
+    def get_state(self):
+        return "stopped"
+
+    def next(self):
+        self.calls.append("next")
+        return {"command": "next", "success": True, "state": "stopped"}
+
+
+def test_step_control_dispatches_to_controller_instance():
+    gdb = FakeGdb()
+    tools = PwndbgTools(gdb, SessionState())
+
+    assert tools.step_control("n")["success"] is True
+    assert gdb.calls == ["next"]
+    assert "Unknown step command" in tools.step_control("jump")["error"]
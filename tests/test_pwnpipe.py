@@ -0,0 +1,69 @@
+from pwnomcp import pwnpipe as pwnpipe_module
+from pwnomcp.pwnpipe import PwnPipe
+
+
+def _drain(pipe: PwnPipe) -> None:
+    pipe._t_read.join(timeout=5)
+    pipe._t_wait.join(timeout=5)
+
+
+def test_release_returns_output_and_clears_buffer():
+    pipe = PwnPipe("printf 'hello\\nworld\\n'")
+    _drain(pipe)
+
+    assert pipe.release() == "hello\nworld\n"
+    assert pipe.release() == ""
+
+
+def test_attach_marker_is_parsed_not_buffered():
+    pipe = PwnPipe("echo 'PWNCLI_ATTACH_RESULT:{\"successful\": true}'; echo after")
+    _drain(pipe)
+
+    assert pipe.get_attach_result() == {"successful": True}
+    assert pipe.release() == "after\n"
+    events = pipe.release_events()
+    assert events[0]["type"] == "attached"
+    assert events[0]["ok"] is True
+    assert {"type": "exit", "code": 0} in events
+
+
+def test_output_buffer_is_bounded(monkeypatch):
+    monkeypatch.setattr(pwnpipe_module, "MAX_BUFFERED_LINES", 2)
+    pipe = PwnPipe("seq 1 5")
+    _drain(pipe)
+
+    assert pipe.release() == "4\n5\n"
+
+
+def test_send_and_output_events_are_text():
+    pipe = PwnPipe("head -n 1")
+    assert pipe.send("héllo\n")
+    _drain(pipe)
+
+    assert pipe.release() == "héllo\n"
+    assert {"type": "out", "data": "héllo\n"} in pipe.release_events()
+
+
+def test_stdout_and_stderr_are_both_collected():
+    pipe = PwnPipe("printf 'a\\nb'; printf 'err\\n' >&2")
+    _drain(pipe)
+
+    assert sorted(pipe.release().splitlines()) == ["a", "b", "err"]
+    events = pipe.release_events()
+    assert {"type": "out", "data": "b"} in events
+    assert {"type": "err", "data": "err\n"} in events
+
+
+def test_wait_ready_reports_first_signal():
+    assert PwnPipe("true").wait_ready(timeout=5)["reason"] == "exited"
+    assert PwnPipe("echo hi; sleep 1").wait_ready(timeout=5)["reason"] == "output"
+    assert PwnPipe("sleep 1").wait_ready(timeout=0.05)["reason"] == "timeout"
+
+
+def test_plain_commands_skip_the_shell():
+    pipe = PwnPipe("printf 'a b'")
+    _drain(pipe)
+
+    assert pipe.proc.args == ["printf", "a b"]
+    assert pipe.release() == "a b"
+    assert PwnPipe("echo $HOME").proc.args == "echo $HOME"
@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+from pwnomcp.tools.backends.retdec import RetDecAnalyzer
+
+
+def _analyzer(monkeypatch, gate: asyncio.Event, calls: list) -> RetDecAnalyzer:
+    monkeypatch.setenv("BINARY_URL", "https://example.invalid/chall")
+    analyzer = RetDecAnalyzer()
+
+    async def fake_initialize_once():
+        calls.append(1)
+        await gate.wait()
+        analyzer.analysis_result = {"status": "success", "run": len(calls)}
+        return analyzer.analysis_result
+
+    monkeypatch.setattr(analyzer, "_initialize_once", fake_initialize_once)
+    return analyzer
+
+
+@pytest.mark.asyncio
+async def test_concurrent_initialize_shares_one_analysis(monkeypatch):
+    gate = asyncio.Event()
+    calls: list = []
+    analyzer = _analyzer(monkeypatch, gate, calls)
+
+    waiters = [asyncio.create_task(analyzer.initialize()) for _ in range(3)]
+    await asyncio.sleep(0)
+    gate.set()
+    results = await asyncio.gather(*waiters)
+
+    assert calls == [1]
+    assert results == [{"status": "success", "run": 1}] * 3
+
+
+@pytest.mark.asyncio
+async def test_initialize_retries_after_cancelled_analysis(monkeypatch):
+    gate = asyncio.Event()
+    calls: list = []
+    analyzer = _analyzer(monkeypatch, gate, calls)
+
+    task = analyzer.start()
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    gate.set()
+    assert await analyzer.initialize() == {"status": "success", "run": 2}
+    assert analyzer.start() is analyzer.start()
@@ -0,0 +1,29 @@
+import json
+
+from pwnomcp.utils import serialize
+from pwnomcp.utils.serialize import dump_json, load_json
+
+
+def test_dump_json_round_trips():
+    result = {"pid": 1, "stdout": "hi\n", "ok": True, "tags": ["a", None]}
+
+    assert json.loads(dump_json(result)) == result
+
+
+def test_dump_json_is_compact_by_default(monkeypatch):
+    monkeypatch.setattr(serialize, "_orjson", None)
+    monkeypatch.setattr(serialize, "PRETTY_JSON", False)
+
+    assert dump_json({"a": 1, "b": [1, 2]}) == '{"a":1,"b":[1,2]}'
+
+
+def test_dump_json_indents_when_pretty(monkeypatch):
+    monkeypatch.setattr(serialize, "_orjson", None)
+    monkeypatch.setattr(serialize, "PRETTY_JSON", True)
+
+    assert dump_json({"a": 1}) == json.dumps({"a": 1}, indent=2)
+
+
+def test_load_json_accepts_bytes_and_text():
+    assert load_json(b'{"successful": true}') == {"successful": True}
+    assert load_json('[1, "a"]') == [1, "a"]
@@ -0,0 +1,37 @@
+import threading
+
+from pwnomcp.state import registry as registry_module
+from pwnomcp.state.registry import DebugSessionRegistry
+from pwnomcp.utils.paths import build_runtime_paths
+
+
+def _lookup_finishes(registry: DebugSessionRegistry) -> bool:
+    # A lookup from another thread must not wait on GDB start/stop
+    worker = threading.Thread(target=registry.get_session, args=("other",))
+    worker.start()
+    worker.join(timeout=1)
+    return not worker.is_alive()
+
+
+def test_gdb_start_and_close_run_outside_registry_lock(tmp_path, monkeypatch):
+    registry = DebugSessionRegistry(
+        build_runtime_paths(str(tmp_path / "ws"), str(tmp_path / "rt"))
+    )
+    seen = []
+
+    class FakeGdb:
+        def close(self):
+            seen.append(("close", _lookup_finishes(registry)))
+
+    def fake_tools(gdb, state):
+        seen.append(("start", _lookup_finishes(registry)))
+
+    monkeypatch.setattr(registry_module, "GdbController", FakeGdb)
+    monkeypatch.setattr(registry_module, "PwndbgTools", fake_tools)
+
+    session = registry.ensure_session("s1")
+    assert registry.create_session("s1") is session
+    assert registry.default_session_id == "s1"
+    assert registry.close_session("s1") == {"success": True, "session_id": "s1"}
+    assert registry.default_session_id is None
+    assert seen == [("start", True), ("close", True)]
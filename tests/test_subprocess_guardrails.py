@@ -1,3 +1,7 @@
+import subprocess
+
+import pytest
+
 from pwnomcp.tools.backends import subproc as subproc_module
 from pwnomcp.tools.backends.subproc import SubprocessTools
 
@@ -50,3 +54,18 @@ def test_spawn_process_blocks_workspace_elf_execution(tmp_path, monkeypatch):
     assert result["success"] is False
     assert result["type"] == "ToolUsageError"
     assert result["recommended_tool"] == "set_file+run"
+
+
+def test_wait_for_exit_returns_code_and_times_out():
+    done = subprocess.Popen(["sh", "-c", "exit 3"])
+    assert subproc_module.wait_for_exit(done, 5) == 3
+    # Reaped, not just reported ready: returncode is set without another poll()
+    assert done.returncode == 3
+
+    sleeper = subprocess.Popen(["sleep", "5"])
+    try:
+        with pytest.raises(subprocess.TimeoutExpired):
+            subproc_module.wait_for_exit(sleeper, 0.05)
+    finally:
+        sleeper.kill()
+        sleeper.wait()